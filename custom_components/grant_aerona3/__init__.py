@@ -1,11 +1,9 @@
 """Grant Aerona3 Heat Pump integration for Home Assistant."""
 import logging
-from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 from .coordinator import GrantAerona3Coordinator
@@ -20,17 +18,16 @@ PLATFORMS = [
     Platform.NUMBER,
 ]
 
-UPDATE_INTERVAL = timedelta(seconds=30)
-
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Grant Aerona3 from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-
     coordinator = GrantAerona3Coordinator(hass, entry)
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data is None:
+        domain_data = hass.data[DOMAIN] = {}
+    domain_data[entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -41,6 +38,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     return unload_ok
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Binary sensor platform for Grant Aerona3 Heat Pump."""
 import logging
-from typing import Any
+from functools import cached_property
+from typing import Any, Callable
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -9,13 +10,97 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL
+from .const import DOMAIN
 from .coordinator import GrantAerona3Coordinator
+from .entity import GrantAerona3CachedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+PARALLEL_UPDATES = 0
+
+
+def _value_above_zero(key: str) -> Callable[[dict[str, Any]], bool | None]:
+    """Return an evaluator that is on when the register value is above zero."""
+    def _evaluate(data: dict[str, Any]) -> bool | None:
+        row = data.get(key)
+        return row.value > 0 if row is not None else None
+    return _evaluate
+
+
+def _value_equals(key: str, expected: int) -> Callable[[dict[str, Any]], bool | None]:
+    """Return an evaluator that is on when the register value matches."""
+    def _evaluate(data: dict[str, Any]) -> bool | None:
+        row = data.get(key)
+        return row.value == expected if row is not None else None
+    return _evaluate
+
+
+def _defrost_active(data: dict[str, Any]) -> bool | None:
+    """Check if defrost temperature is significantly different from outdoor temp."""
+    defrost = data.get("input_5")
+    outdoor = data.get("input_6")
+    if defrost is None or outdoor is None:
+        return None
+    # Simple heuristic: defrost active if defrost temp > outdoor temp + 5°C
+    return defrost.value > (outdoor.value + 5)
+
+
+def _register_attributes(**keys: str) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Return a builder mapping attribute names to register values."""
+    def _build(data: dict[str, Any]) -> dict[str, Any]:
+        attrs = {}
+        for attr, key in keys.items():
+            row = data.get(key)
+            if row is not None:
+                attrs[attr] = row.value
+        return attrs
+    return _build
+
+
+def _no_attributes(data: dict[str, Any]) -> dict[str, Any]:
+    """Return no extra attributes."""
+    return {}
+
+
+# Evaluators for is_on, resolved once per entity at construction time
+_IS_ON_DISPATCH: dict[str, Callable[[dict[str, Any]], bool | None]] = {
+    "heating": _value_equals("input_10", 1),  # Operating mode is heating (1)
+    "cooling": _value_equals("input_10", 2),  # Operating mode is cooling (2)
+    "dhw": _value_above_zero("input_13"),  # DHW mode is active (not disabled)
+    "defrost": _defrost_active,
+    "compressor": _value_above_zero("input_1"),  # Compressor frequency > 0
+    "pump": _value_above_zero("input_7"),  # Water pump speed > 0
+    "fan": _value_above_zero("input_4"),  # Fan speed > 0
+}
+
+# Extra state attribute builders for sensor types that expose register data
+_ATTRIBUTES_DISPATCH: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "compressor": _register_attributes(frequency="input_1"),
+    "pump": _register_attributes(speed="input_7"),
+    "fan": _register_attributes(speed="input_4"),
+    "defrost": _register_attributes(
+        defrost_temperature="input_5", outdoor_temperature="input_6"
+    ),
+}
+
+# (sensor_type, name) for every status binary sensor
+_BINARY_SENSORS = (
+    ("heating", "Heating Active"),
+    ("cooling", "Cooling Active"),
+    ("dhw", "DHW Active"),
+    ("defrost", "Defrost Active"),
+    ("compressor", "Compressor Running"),
+    ("pump", "Water Pump Running"),
+    ("fan", "Fan Running"),
+)
+
+# Device class overrides; every other sensor type is RUNNING
+_DEVICE_CLASSES = {
+    "heating": BinarySensorDeviceClass.HEAT,
+    "cooling": BinarySensorDeviceClass.HEAT,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,22 +110,18 @@ async def async_setup_entry(
     """Set up Grant Aerona3 binary sensor entities."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = [
-        GrantAerona3StatusSensor(coordinator, config_entry, "heating", "Heating Active"),
-        GrantAerona3StatusSensor(coordinator, config_entry, "cooling", "Cooling Active"),
-        GrantAerona3StatusSensor(coordinator, config_entry, "dhw", "DHW Active"),
-        GrantAerona3StatusSensor(coordinator, config_entry, "defrost", "Defrost Active"),
-        GrantAerona3StatusSensor(coordinator, config_entry, "compressor", "Compressor Running"),
-        GrantAerona3StatusSensor(coordinator, config_entry, "pump", "Water Pump Running"),
-        GrantAerona3StatusSensor(coordinator, config_entry, "fan", "Fan Running"),
-    ]
-    
-    async_add_entities(entities)
+    async_add_entities(
+        GrantAerona3StatusSensor(coordinator, config_entry, sensor_type, name)
+        for sensor_type, name in _BINARY_SENSORS
+    )
 
 
-class GrantAerona3StatusSensor(CoordinatorEntity, BinarySensorEntity):
+class GrantAerona3StatusSensor(GrantAerona3CachedEntity, BinarySensorEntity):
     """Grant Aerona3 status binary sensor."""
 
+    # Derived from coordinator data, recomputed only after a coordinator update
+    _CACHED_PROPERTIES = ("is_on", "extra_state_attributes")
+
     def __init__(
         self,
         coordinator: GrantAerona3Coordinator,
@@ -51,91 +132,28 @@ class GrantAerona3StatusSensor(CoordinatorEntity, BinarySensorEntity):
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._sensor_type = sensor_type
+        self._is_on = _IS_ON_DISPATCH[sensor_type]
+        self._attributes = _ATTRIBUTES_DISPATCH.get(sensor_type, _no_attributes)
         
         self._attr_unique_id = f"{config_entry.entry_id}_binary_sensor_{sensor_type}"
         self._attr_name = f"Grant Aerona3 {name}"
         
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
         
         # Set device class based on sensor type
-        if sensor_type in ["heating", "cooling"]:
-            self._attr_device_class = BinarySensorDeviceClass.HEAT
-        elif sensor_type == "compressor":
-            self._attr_device_class = BinarySensorDeviceClass.RUNNING
-        elif sensor_type in ["pump", "fan"]:
-            self._attr_device_class = BinarySensorDeviceClass.RUNNING
-        else:
-            self._attr_device_class = BinarySensorDeviceClass.RUNNING
-
-    @property
+        self._attr_device_class = _DEVICE_CLASSES.get(
+            sensor_type, BinarySensorDeviceClass.RUNNING
+        )
+
+    @cached_property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if self._sensor_type == "heating":
-            # Check if operating mode is heating (1)
-            if "input_10" in self.coordinator.data:
-                return self.coordinator.data["input_10"]["value"] == 1
-                
-        elif self._sensor_type == "cooling":
-            # Check if operating mode is cooling (2)
-            if "input_10" in self.coordinator.data:
-                return self.coordinator.data["input_10"]["value"] == 2
-                
-        elif self._sensor_type == "dhw":
-            # Check if DHW mode is active (not disabled)
-            if "input_13" in self.coordinator.data:
-                return self.coordinator.data["input_13"]["value"] > 0
-                
-        elif self._sensor_type == "defrost":
-            # Check if defrost temperature is significantly different from outdoor temp
-            if "input_5" in self.coordinator.data and "input_6" in self.coordinator.data:
-                defrost_temp = self.coordinator.data["input_5"]["value"]
-                outdoor_temp = self.coordinator.data["input_6"]["value"]
-                # Simple heuristic: defrost active if defrost temp > outdoor temp + 5°C
-                return defrost_temp > (outdoor_temp + 5)
-                
-        elif self._sensor_type == "compressor":
-            # Check if compressor frequency > 0
-            if "input_1" in self.coordinator.data:
-                return self.coordinator.data["input_1"]["value"] > 0
-                
-        elif self._sensor_type == "pump":
-            # Check if water pump speed > 0
-            if "input_7" in self.coordinator.data:
-                return self.coordinator.data["input_7"]["value"] > 0
-                
-        elif self._sensor_type == "fan":
-            # Check if fan speed > 0
-            if "input_4" in self.coordinator.data:
-                return self.coordinator.data["input_4"]["value"] > 0
-        
-        return None
+        return self._is_on(self.coordinator.data)
 
-    @property
+    @cached_property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         attrs = {"sensor_type": self._sensor_type}
-        
-        # Add relevant data based on sensor type
-        if self._sensor_type == "compressor" and "input_1" in self.coordinator.data:
-            attrs["frequency"] = self.coordinator.data["input_1"]["value"]
-            
-        elif self._sensor_type == "pump" and "input_7" in self.coordinator.data:
-            attrs["speed"] = self.coordinator.data["input_7"]["value"]
-            
-        elif self._sensor_type == "fan" and "input_4" in self.coordinator.data:
-            attrs["speed"] = self.coordinator.data["input_4"]["value"]
-            
-        elif self._sensor_type == "defrost":
-            if "input_5" in self.coordinator.data:
-                attrs["defrost_temperature"] = self.coordinator.data["input_5"]["value"]
-            if "input_6" in self.coordinator.data:
-                attrs["outdoor_temperature"] = self.coordinator.data["input_6"]["value"]
-        
-        return attrs
\ No newline at end of file
+        attrs.update(self._attributes(self.coordinator.data))
+        return attrs
@@ -1,5 +1,6 @@
 """Climate platform for Grant Aerona3 Heat Pump."""
 import logging
+from functools import cached_property
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -11,13 +12,27 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL, OPERATING_MODES
+from .const import (
+    COIL_DATA_KEYS,
+    DOMAIN,
+    HOLDING_DATA_KEYS,
+    INPUT_DATA_KEYS,
+    OPERATING_MODES,
+)
 from .coordinator import GrantAerona3Coordinator
+from .entity import GrantAerona3CachedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+PARALLEL_UPDATES = 0
+
+# Heating zones exposed as climate entities
+_ZONES = (1, 2)
+
+# HVAC mode indexed by the operating mode register value (input 10)
+_HVAC_MODES = (HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,17 +42,22 @@ async def async_setup_entry(
     """Set up Grant Aerona3 climate entities."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = [
-        GrantAerona3Climate(coordinator, config_entry, 1),  # Zone 1
-        GrantAerona3Climate(coordinator, config_entry, 2),  # Zone 2
-    ]
-    
-    async_add_entities(entities)
+    async_add_entities(
+        GrantAerona3Climate(coordinator, config_entry, zone) for zone in _ZONES
+    )
 
 
-class GrantAerona3Climate(CoordinatorEntity, ClimateEntity):
+class GrantAerona3Climate(GrantAerona3CachedEntity, ClimateEntity):
     """Grant Aerona3 Climate entity."""
 
+    # Derived from coordinator data, recomputed only after a coordinator update
+    _CACHED_PROPERTIES = (
+        "current_temperature",
+        "target_temperature",
+        "hvac_mode",
+        "extra_state_attributes",
+    )
+
     def __init__(
         self,
         coordinator: GrantAerona3Coordinator,
@@ -47,17 +67,27 @@ class GrantAerona3Climate(CoordinatorEntity, ClimateEntity):
         """Initialize the climate entity."""
         super().__init__(coordinator)
         self._zone = zone
+
+        # Register keys for this zone, fixed for the lifetime of the entity
+        self._write_address = 2 if zone == 1 else 7
+        self._holding_key = HOLDING_DATA_KEYS[self._write_address]
+        self._set_temp_key = INPUT_DATA_KEYS[10 + zone]
+        self._wc_key = COIL_DATA_KEYS[1 + zone]
+
+        # (attribute name, data key) pairs exposed as extra state attributes
+        self._attribute_keys = (
+            ("zone_set_temperature", self._set_temp_key),
+            ("weather_compensation", self._wc_key),
+            ("outdoor_temperature", "input_6"),
+            ("return_water_temperature", "input_0"),
+            ("power_consumption", "input_3"),
+        )
+
         self._attr_unique_id = f"{config_entry.entry_id}_climate_zone_{zone}"
         self._attr_name = f"Grant Aerona3 Zone {zone}"
         
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
         # Climate capabilities
         self._attr_supported_features = (
@@ -72,64 +102,34 @@ class GrantAerona3Climate(CoordinatorEntity, ClimateEntity):
         self._attr_min_temp = 23.0
         self._attr_max_temp = 60.0
 
-    @property
+    @cached_property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
         # Use outgoing water temperature as current temperature
-        if "input_9" in self.coordinator.data:
-            return self.coordinator.data["input_9"]["value"]
-        return None
+        row = self.coordinator.data.get("input_9")
+        return row.value if row is not None else None
 
-    @property
+    @cached_property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
         # Get the fixed flow temperature for this zone
-        holding_key = f"holding_{2 if self._zone == 1 else 7}"
-        if holding_key in self.coordinator.data:
-            return self.coordinator.data[holding_key]["value"]
-        return None
+        row = self.coordinator.data.get(self._holding_key)
+        return row.value if row is not None else None
 
-    @property
+    @cached_property
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode."""
-        if "input_10" in self.coordinator.data:
-            mode = self.coordinator.data["input_10"]["value"]
-            if mode == 0:
-                return HVACMode.OFF
-            elif mode == 1:
-                return HVACMode.HEAT
-            elif mode == 2:
-                return HVACMode.COOL
-        return HVACMode.OFF
-
-    @property
+        row = self.coordinator.data.get("input_10")
+        mode = row.value if row is not None else 0
+        return _HVAC_MODES[mode] if 0 <= mode < len(_HVAC_MODES) else HVACMode.OFF
+
+    @cached_property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        attrs = {}
-        
-        # Add zone-specific set temperature
-        set_temp_key = f"input_{10 + self._zone}"
-        if set_temp_key in self.coordinator.data:
-            attrs["zone_set_temperature"] = self.coordinator.data[set_temp_key]["value"]
-        
-        # Add weather compensation status
-        wc_key = f"coil_{1 + self._zone}"
-        if wc_key in self.coordinator.data:
-            attrs["weather_compensation"] = self.coordinator.data[wc_key]["value"]
-        
-        # Add outdoor temperature
-        if "input_6" in self.coordinator.data:
-            attrs["outdoor_temperature"] = self.coordinator.data["input_6"]["value"]
-        
-        # Add return water temperature
-        if "input_0" in self.coordinator.data:
-            attrs["return_water_temperature"] = self.coordinator.data["input_0"]["value"]
-        
-        # Add power consumption
-        if "input_3" in self.coordinator.data:
-            attrs["power_consumption"] = self.coordinator.data["input_3"]["value"]
-        
-        return attrs
+        data = self.coordinator.data
+        return {
+            name: data[key].value for name, key in self._attribute_keys if key in data
+        }
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -137,14 +137,25 @@ class GrantAerona3Climate(CoordinatorEntity, ClimateEntity):
         if temperature is None:
             return
 
-        # Convert temperature to raw value (multiply by 2 for 0.5°C resolution)
-        raw_value = int(temperature * 2)
-        
-        # Determine the holding register address for this zone
-        address = 2 if self._zone == 1 else 7
+        # Reject out-of-range values before touching the Modbus bus
+        if not self._attr_min_temp <= temperature <= self._attr_max_temp:
+            _LOGGER.warning(
+                "Temperature %s is out of bounds (%s-%s) for zone %s",
+                temperature,
+                self._attr_min_temp,
+                self._attr_max_temp,
+                self._zone,
+            )
+            return
+
+        # Convert temperature to raw value (multiply by 2 for 0.5°C resolution),
+        # rounding so float error like 45.3 * 2 = 90.59999 does not truncate
+        raw_value = int(round(temperature * 2))
         
-        # Write to the holding register
-        success = await self.coordinator.async_write_holding_register(address, raw_value)
+        # Write to the holding register for this zone
+        success = await self.coordinator.async_write_holding_register(
+            self._write_address, raw_value
+        )
         
         if success:
             # Request immediate update
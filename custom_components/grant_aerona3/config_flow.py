@@ -1,16 +1,17 @@
 """Unified config flow for Grant Aerona3 Heat Pump integration with installation type selection."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-from pymodbus.client import ModbusTcpClient
+from pymodbus.exceptions import ModbusException
 
 from .const import (
     CONF_SCAN_INTERVAL,
@@ -20,6 +21,7 @@ from .const import (
     DEFAULT_SLAVE_ID,
     DOMAIN,
 )
+from .coordinator import GrantAerona3Coordinator, async_stash_pending_client
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,36 +70,16 @@ STEP_ENHANCED_ADVANCED_SCHEMA = vol.Schema({
 
 async def validate_connection(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    
-    def _test_connection():
-        """Test connection to the Modbus device."""
-        client = ModbusTcpClient(
-            host=data[CONF_HOST],
-            port=data[CONF_PORT],
-            timeout=10
+    host, port = data[CONF_HOST], data[CONF_PORT]
+    try:
+        client = await GrantAerona3Coordinator.async_test_connection(
+            host, port, data[CONF_SLAVE_ID]
         )
+    except (ModbusException, OSError, asyncio.TimeoutError) as err:
+        raise CannotConnect(f"Failed to connect to Modbus device: {err}") from err
 
-        try:
-            if not client.connect():
-                raise CannotConnect("Failed to connect to Modbus device")
-
-            # Try to read a register to verify communication
-            result = client.read_input_registers(
-                address=0,
-                count=1,
-                slave=data[CONF_SLAVE_ID]
-            )
-
-            if result.isError():
-                raise CannotConnect("Failed to read from Modbus device")
-
-            return True
-
-        finally:
-            client.close()
-
-    # Test connection in executor to avoid blocking
-    await hass.async_add_executor_job(_test_connection)
+    # Hand the open connection to the coordinator instead of reconnecting
+    async_stash_pending_client(hass, host, port, client)
 
     # Return info that you want to store in the config entry
     return {"title": f"Grant Aerona3 ({data[CONF_HOST]})"}
@@ -149,7 +131,7 @@ class GrantAerona3ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
                 errors["base"] = "invalid_auth"
-            except Exception as err:
+            except Exception:
                 _LOGGER.exception("Unexpected exception during basic setup")
                 errors["base"] = "unknown"
             else:
@@ -195,7 +177,7 @@ class GrantAerona3ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
                 errors["base"] = "invalid_auth"
-            except Exception as err:
+            except Exception:
                 _LOGGER.exception("Unexpected exception during enhanced connection setup")
                 errors["base"] = "unknown"
 
@@ -1,11 +1,14 @@
 """Constants for Grant Aerona3 Heat Pump integration."""
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Any, Final, NamedTuple
+
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
-from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.const import (
     UnitOfTemperature,
     UnitOfPower,
     UnitOfFrequency,
-    PERCENTAGE,
 )
 # Domain
 DOMAIN = "grant_aerona3"
@@ -73,13 +76,39 @@ DEFAULT_PORT = 502
 DEFAULT_SLAVE_ID = 1
 DEFAULT_SCAN_INTERVAL = 30
 
+# Connection test used by the config flows
+CONNECTION_TEST_TIMEOUT = 3  # seconds per attempt
+CONNECTION_TEST_ATTEMPTS = 2
+
+# A client opened by the connection test is handed to the coordinator
+# if the entry is created within this many seconds, otherwise closed
+PENDING_CLIENT_TTL = 60
+PENDING_CLIENTS = "pending_clients"
+
 # Register types
 INPUT_REGISTERS = "input"
 HOLDING_REGISTERS = "holding"
 COIL_REGISTERS = "coil"
 
+
+class RegSpec(NamedTuple):
+    """Static metadata for a single Modbus register."""
+
+    name: str
+    unit: str | None = None
+    device_class: Any = None
+    state_class: Any = None
+    scale: float = 1
+    offset: float = 0
+    description: str = ""
+    writable: bool = False
+
+
 # INPUT REGISTERS - Fixed scaling for temperatures
-INPUT_REGISTER_MAP = {
+# Registers 13-15 and 20-31 (DHW mode, day, legionella time, humidity and
+# the error code history) are left unmapped: the reference list marks the
+# error history codes as unconfirmed
+_INPUT_REGISTER_MAP_RAW = {
     0: {
         "name": "Return Water Temperature",
         "unit": UnitOfTemperature.CELSIUS,
@@ -87,7 +116,6 @@ INPUT_REGISTER_MAP = {
         "state_class": SensorStateClass.MEASUREMENT,
         "scale": 0.1,  # ✅ Fixed: was 1, now 0.1
         "offset": 0,
-        "description": "Return water temperature"
     },
     1: {
         "name": "Compressor Operating Frequency",
@@ -96,7 +124,6 @@ INPUT_REGISTER_MAP = {
         "state_class": SensorStateClass.MEASUREMENT,
         "scale": 1,  # ✅ Correct: frequencies don't need scaling
         "offset": 0,
-        "description": "Compressor operating frequency"
     },
     2: {
         "name": "Discharge Temperature",
@@ -105,7 +132,6 @@ INPUT_REGISTER_MAP = {
         "state_class": SensorStateClass.MEASUREMENT,
         "scale": 0.1,  # ✅ Fixed: was 1, now 0.1
         "offset": 0,
-        "description": "Discharge temperature"
     },
     3: {
         "name": "Current Consumption Value",
@@ -114,7 +140,6 @@ INPUT_REGISTER_MAP = {
         "state_class": SensorStateClass.MEASUREMENT,
         "scale": 100,  # ✅ Correct: power often needs scaling
         "offset": 0,
-        "description": "Current consumption value"
     },
     4: {
         "name": "Fan Control Number Of Rotation",
@@ -123,7 +148,6 @@ INPUT_REGISTER_MAP = {
         "state_class": None,
         "scale": 10,  # ✅ Correct: RPM scaling
         "offset": 0,
-        "description": "Fan control number of rotation"
     },
     5: {
         "name": "Defrost Temperature",
@@ -132,7 +156,6 @@ INPUT_REGISTER_MAP = {
         "state_class": SensorStateClass.MEASUREMENT,
         "scale": 0.1,  # ✅ Fixed: was 1, now 0.1
         "offset": 0,
-        "description": "Defrost temperature"
     },
     6: {
         "name": "Outdoor Air Temperature",
@@ -141,7 +164,6 @@ INPUT_REGISTER_MAP = {
         "state_class": SensorStateClass.MEASUREMENT,
         "scale": 0.1,  # ✅ Fixed: was 1, now 0.1
         "offset": 0,
-        "description": "Outdoor air temperature"
     },
     7: {
         "name": "Water Pump Control Number Of Rotation",
@@ -150,7 +172,6 @@ INPUT_REGISTER_MAP = {
         "state_class": None,
         "scale": 100,  # ✅ Correct: pump RPM scaling
         "offset": 0,
-        "description": "Water pump control number of rotation"
     },
     8: {
         "name": "Suction Temperature",
@@ -159,7 +180,6 @@ INPUT_REGISTER_MAP = {
         "state_class": SensorStateClass.MEASUREMENT,
         "scale": 0.1,  # ✅ Fixed: was 1, now 0.1
         "offset": 0,
-        "description": "Suction temperature"
     },
     9: {
         "name": "Outgoing Water Temperature",
@@ -168,7 +188,6 @@ INPUT_REGISTER_MAP = {
         "state_class": SensorStateClass.MEASUREMENT,
         "scale": 0.1,  # ✅ Fixed: was 1, now 0.1
         "offset": 0,
-        "description": "Outgoing water temperature"
     },
     10: {
         "name": "Selected Operating Mode",
@@ -240,12 +259,11 @@ INPUT_REGISTER_MAP = {
         "state_class": SensorStateClass.MEASUREMENT,
         "scale": 0.1,  # ✅ Fixed: was 1, should be 0.1
         "offset": 0,
-        "description": "Plate heat exchanger temperature"
     },
 }
 
 # Holding Registers (Read/Write configuration settings)
-HOLDING_REGISTER_MAP = {
+_HOLDING_REGISTER_MAP_RAW = {
     2: {
         "name": "Fixed Flow Temp Zone 1",
         "unit": UnitOfTemperature.CELSIUS,
@@ -433,7 +451,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Hysteresis of water set point in Heating and DHW"
     },
     23: {
         "name": "Hysteresis Of Water Set Point In Cooling",
@@ -442,7 +459,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Hysteresis of water set point in Cooling"
     },
     24: {
         "name": "Low Tariff Deferential Water Set Point For Heating",
@@ -451,7 +467,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Low tariff deferential water set point for Heating"
     },
     25: {
         "name": "Low Tariff Deferential Water Set Point For Cooling",
@@ -460,7 +475,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Low tariff deferential water set point for Cooling"
     },
     26: {
         "name": "DHW Production Priority Setting",
@@ -487,7 +501,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "DHW Comfort set temperature"
     },
     29: {
         "name": "DHW Economy Set Temperature",
@@ -496,7 +509,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "DHW Economy set temperature"
     },
     30: {
         "name": "DHW Set Point Hysteresis",
@@ -505,7 +517,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "DHW set point hysteresis"
     },
     31: {
         "name": "DHW Over Boost Mode Set Point",
@@ -514,7 +525,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "DHW Over boost mode set point"
     },
     32: {
         "name": "Max. Time For DHW Request",
@@ -523,7 +533,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Max. time for DHW request"
     },
     33: {
         "name": "Delay Time On DHW Heater From Off Compressor",
@@ -532,7 +541,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Delay time on DHW heater from OFF compressor"
     },
     34: {
         "name": "Outdoor Air Temperature To Enable DHW Heaters",
@@ -541,7 +549,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Outdoor air temperature to enable DHW heaters"
     },
     35: {
         "name": "Outdoor Air Temperature Hysteresis To Disable DHW Heaters",
@@ -550,7 +557,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Outdoor air temperature hysteresis to disable DHW heaters"
     },
     36: {
         "name": "Anti-legionella Set Point",
@@ -559,7 +565,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Anti-legionella set point"
     },
     37: {
         "name": "Max. Frequency Of Night Mode",
@@ -568,7 +573,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Max. frequency of Night mode"
     },
     38: {
         "name": "Min. Time Compressor On/off Time",
@@ -577,7 +581,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Min. time compressor ON/OFF time"
     },
     39: {
         "name": "Delay Time Pump Off From Compressor Off",
@@ -586,7 +589,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Delay time pump OFF from compressor OFF"
     },
     40: {
         "name": "Delay Time Compressor On From Pump On",
@@ -595,7 +597,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Delay time compressor ON from pump ON"
     },
     41: {
         "name": "Type Of Configuration Of Main Water Pump",
@@ -613,7 +614,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Time ON Main water pump for Sniffing cycle"
     },
     43: {
         "name": "Time Off Main Water Pump",
@@ -622,7 +622,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Time OFF Main water pump"
     },
     44: {
         "name": "Delay Time Off Main Water Pump From Off Compressor",
@@ -631,7 +630,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Delay time OFF Main water pump from OFF compressor"
     },
     45: {
         "name": "Off Time For Unlock Pump Function Start",
@@ -640,7 +638,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "OFF time for Unlock pump function start"
     },
     46: {
         "name": "Time On Main Water Pump For Unlock Pump Function",
@@ -649,7 +646,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Time ON Main water pump for Unlock pump function"
     },
     47: {
         "name": "Time On Water Pump1 For Unlock Pump Function",
@@ -658,7 +654,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Time ON water pump1 for Unlock pump function"
     },
     48: {
         "name": "Time On Water Pump2 For Unlock Pump Function",
@@ -667,7 +662,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Time ON water pump2 for Unlock pump function"
     },
     49: {
         "name": "Type Of Operation Of Additional Water Pump",
@@ -694,7 +688,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Hysteresis of Room air temperature of Frost protection"
     },
     52: {
         "name": "Water Temperature Of Frost Protection",
@@ -703,7 +696,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Water temperature of Frost protection"
     },
     53: {
         "name": "Delay Time Off Main Water Pump From Off",
@@ -730,7 +722,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Hysteresis of Outdoor air temperature"
     },
     56: {
         "name": "Backup Heater Set Point During Frost Protection",
@@ -739,7 +730,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Backup heater set point during Frost protection"
     },
     57: {
         "name": "Hysteresis Of Outgoing Water Temperature",
@@ -748,7 +738,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Hysteresis of Outgoing water temperature"
     },
     58: {
         "name": "Start Temperature Of Frost Protection On DHW Tank Temp",
@@ -766,7 +755,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Hysteresis of DHW tank temperature"
     },
     60: {
         "name": "Room Relative Humidity Value",
@@ -775,7 +763,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Room relative humidity value"
     },
     61: {
         "name": "Room Relative Humidity Value To Start Increasing Flow Temp",
@@ -811,7 +798,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Mixing valve integral factor"
     },
     65: {
         "name": "Max Water Temperature In Mixing Circuit",
@@ -820,7 +806,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Max Water temperature in mixing circuit"
     },
     66: {
         "name": "3way Valve Change Over Time",
@@ -829,7 +814,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "3way valve change over time"
     },
     67: {
         "name": "Flow Switch Alarm Delay Time At. Pump Start Up",
@@ -838,7 +822,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Flow switch alarm delay time at. Pump start up"
     },
     68: {
         "name": "Flow Switch Alarm Delay Time",
@@ -856,7 +839,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "The number of retry until displaying alarm"
     },
     70: {
         "name": "The Time Of Repeating Retry Until Displaying Alarm",
@@ -865,7 +847,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "The time of repeating retry until displaying alarm"
     },
     71: {
         "name": "Backup Heater Type Of Function",
@@ -883,7 +864,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Manual water set point"
     },
     73: {
         "name": "Manual Water Temperature Hysteresis",
@@ -892,7 +872,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Manual water temperature hysteresis"
     },
     74: {
         "name": "Delay Time Of The Heater Off That Avoid Flow Switch Alarm",
@@ -901,7 +880,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Delay time of the heater OFF that avoid flow switch alarm"
     },
     75: {
         "name": "Heater Activation Delay Time",
@@ -910,7 +888,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Heater activation delay time"
     },
     76: {
         "name": "Integration Time For Starting Heaters",
@@ -919,7 +896,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Integration time for starting heaters"
     },
     77: {
         "name": "Outdoor Air Temperature To Enable Backup Heater",
@@ -937,7 +913,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Outdoor air temperature hysteresis to disable Backup heaters and enable compressor"
     },
     79: {
         "name": "Outdoor Air Temperature To Enable Backup Heaters",
@@ -955,7 +930,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Outdoor air temperature hysteresis to disable Backup heaters (Supplementary mode)"
     },
     81: {
         "name": "Freeze Protection Functions",
@@ -973,7 +947,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Outgoing water temperature set point during Start-up"
     },
     83: {
         "name": "Hysteresis Water Temperature Set Point During Start-up",
@@ -982,7 +955,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Hysteresis water temperature set point during Start-up"
     },
     84: {
         "name": "EHS Type Of Function",
@@ -1000,7 +972,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Outdoor air temperature to enable EHS and disable compressor"
     },
     86: {
         "name": "Outdoor Air Temperature Hysteresis To Disable Enable Compressor",
@@ -1036,7 +1007,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "EHS activation delay time"
     },
     90: {
         "name": "Integration Time For Starting EHS",
@@ -1045,7 +1015,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 1,
         "offset": 0,
         "writable": True,
-        "description": "Integration time for starting EHS"
     },
     91: {
         "name": "Terminal 20-21 : On/off Remote Contact Or EHS Alarm",
@@ -1108,7 +1077,6 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Buffer tank set point for Heating"
     },
     100: {
         "name": "Buffer Tank Set Point For Cooling",
@@ -1117,168 +1085,91 @@ HOLDING_REGISTER_MAP = {
         "scale": 0.1,
         "offset": 0,
         "writable": True,
-        "description": "Buffer tank set point for Cooling"
     },
 }
 
-# Coil Registers (Read/Write boolean controls)
-COIL_REGISTER_MAP = {
-    1: {
-        "name": "Operation At The Time Of Reboot After Blackout 0",
-        "device_class": None,
-        "description": "Operation at the time of reboot after blackout 0 = disable 1 = enable"
-    },
-    2: {
-        "name": "Heating Weather Compensation Zone 1",
-        "device_class": None,
-        "description": "Heating Zone1, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve)"
-    },
-    3: {
-        "name": "Heating Weather Compensation Zone 2",
-        "device_class": None,
-        "description": "Heating Zone2, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve"
-    },
-    4: {
-        "name": "Cooling Weather Compensation Zone 1",
-        "device_class": None,
-        "description": "Cooling Zone1, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve"
-    },
-    5: {
-        "name": "Cooling Weather Compensation Zone 2",
-        "device_class": None,
-        "description": "Cooling Zone2, enable Outgoing water set point (0=Fixed set point, 1=Climatic Curve"
-    },
-    6: {
-        "name": "Anti-legionella Function",
-        "device_class": None,
-        "description": "Anti-legionella function (0=disable, 1=enable)"
-    },
-    7: {
-        "name": "The HP Unit Turns On/off Based On",
-        "device_class": None,
-        "description": "The HP unit turns ON/OFF based on (0=Room set point, 1=Water set point)"
-    },
-    8: {
-        "name": "Frost Protection Based On Room Temperature",
-        "device_class": None,
-        "description": "Frost Protection based on Room Temperature"
-    },
-    9: {
-        "name": "Frost Protection Based On Outdoor Temperature",
-        "device_class": None,
-        "description": "Frost protection by outdoor temperature 0=disable 1 = enable"
-    },
-    10: {
-        "name": "Frost Protection Based On Flow Temp",
-        "device_class": None,
-        "description": "Frost protection based on Outgoing water temperature 0=disable 1 = enable"
-    },
-    11: {
-        "name": "DHW Storage Frost Protection",
-        "device_class": None,
-        "description": "DHW storage frost protection 0=disable 1 = enable"
-    },
-    12: {
-        "name": "Secondary System Circuit Frost Protection",
-        "device_class": None,
-        "description": "Secondary system circuit frost protection 0=disable 1 = enable"
-    },
-    13: {
-        "name": "Compensation For Room Humidity",
-        "device_class": None,
-        "description": "Compensation for room humidity (0=disable, 1=enable)"
-    },
-    14: {
-        "name": "Conditions To Be Available Backup Heaters",
-        "device_class": None,
-        "description": "Conditions to be available Backup heaters (0=always enabled, 1=depends on Outdoor Air temperature"
-    },
-    16: {
-        "name": "Terminal 1-2-3 : Remote Controller",
-        "device_class": None,
-        "description": "Terminal 1-2-3 : Remote Controller (0=disable, 1=enable)"
-    },
-    17: {
-        "name": "Terminal 4-5-6 : 3way Mixing Valve",
-        "device_class": None,
-        "description": "Terminal 4-5-6 : 3way mixing valve (0=disable, 1=enable)"
-    },
-    18: {
-        "name": "Terminal 7-8 : DHW Tank Temperature Probe",
-        "device_class": None,
-        "description": "Terminal 7-8 : DHW tank temperature probe (0=disable, 1=enable)"
-    },
-    19: {
-        "name": "Terminal 9-10 : Outdoor Air Temperature Probe",
-        "device_class": None,
-        "description": "Terminal 9-10 : Outdoor air temperature probe (additional) (0=disable, 1=enable)"
-    },
-    20: {
-        "name": "Terminal 11-12 : Buffer Tank Temperature Probe",
-        "device_class": None,
-        "description": "Terminal 11-12 : Buffer tank temperature probe (0=disable, 1=enable)"
-    },
-    21: {
-        "name": "Terminal 13-14 : Mix Water Temperature Probe",
-        "device_class": None,
-        "description": "Terminal 13-14 : Mix Water temperature probe (0=disable, 1=enable)"
-    },
-    22: {
-        "name": "Terminal 15-16-32 : Rs485 Mod Bus",
-        "device_class": None,
-        "description": "Terminal 15-16-32 : RS485 Mod Bus (0=disable, 1=enable)"
-    },
-    23: {
-        "name": "Terminal 17-18 : Humidity Sensor",
-        "device_class": None,
-        "description": "Terminal 17-18 : Humidity sensor (0=disable, 1=enable)"
-    },
-    24: {
-        "name": "Terminal 19-18 : DHW Remote Contact",
-        "device_class": None,
-        "description": "Terminal 19-18 : DHW remote contact (0=disable (Remote controller only), 1=enable)"
-    },
-    25: {
-        "name": "Terminal 22-23 : Dual Set Point Control",
-        "device_class": None,
-        "description": "Terminal 22-23 : Dual set point control (0=disable, 1=enable)"
-    },
-    26: {
-        "name": "Terminal 26-27 : Flow Switch",
-        "device_class": None,
-        "description": "Terminal 26-27 : Flow switch (0=disable, 1=enable)"
-    },
-    27: {
-        "name": "Terminal 28-29 : Night Mode",
-        "device_class": None,
-        "description": "Terminal 28-29 : Night mode (0=disable (Remote controller only), 1=enable)"
-    },
-    28: {
-        "name": "Terminal 30-31 : Low Tariff",
-        "device_class": None,
-        "description": "Terminal 30-31 : Low tariff (0=disable (Remote controller only), 1=enable)"
-    },
-    29: {
-        "name": "Terminal 41-42 : EHS",
-        "device_class": None,
-        "description": "Terminal 41-42 : EHS (External heat source for space heating) (0=disable, 1=enable)"
-    },
-    30: {
-        "name": "Terminal 43-44 : Heating/cooling Mode Output",
-        "device_class": None,
-        "description": "Terminal 43-44 : Heating/Cooling mode output (0=disable, 1=Indication of Cooling mode (CLOSE=Cooling), 2=indication of Heating mode (CLOSE=Heating))"
-    },
-    31: {
-        "name": "Terminal 45 : Dehumidifier",
-        "device_class": None,
-        "description": "Terminal 45 : Dehumidifier (0=disable, 1=enable)"
-    },
-    32: {
-        "name": "Terminal 46 : DHW Electric Heater Or Backup Heater",
-        "device_class": None,
-        "description": "Terminal 46 : DHW Electric heater or Backup heater (0=DHW Electric heater, 1=Backup heater)"
-    },
-}
+# Coil Registers (Read/Write boolean controls), one "address|name|description"
+# row per coil; an omitted description falls back to the name
+_COIL_REGISTERS_TABLE = """\
+1|Operation At The Time Of Reboot After Blackout 0|Operation at the time of reboot after blackout 0 = disable 1 = enable
+2|Heating Weather Compensation Zone 1|Heating Zone1, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve)
+3|Heating Weather Compensation Zone 2|Heating Zone2, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve
+4|Cooling Weather Compensation Zone 1|Cooling Zone1, enable Outgoing water set point (0=Fixed set point, 1=Climatic curve
+5|Cooling Weather Compensation Zone 2|Cooling Zone2, enable Outgoing water set point (0=Fixed set point, 1=Climatic Curve
+6|Anti-legionella Function|Anti-legionella function (0=disable, 1=enable)
+7|The HP Unit Turns On/off Based On|The HP unit turns ON/OFF based on (0=Room set point, 1=Water set point)
+8|Frost Protection Based On Room Temperature
+9|Frost Protection Based On Outdoor Temperature|Frost protection by outdoor temperature 0=disable 1 = enable
+10|Frost Protection Based On Flow Temp|Frost protection based on Outgoing water temperature 0=disable 1 = enable
+11|DHW Storage Frost Protection|DHW storage frost protection 0=disable 1 = enable
+12|Secondary System Circuit Frost Protection|Secondary system circuit frost protection 0=disable 1 = enable
+13|Compensation For Room Humidity|Compensation for room humidity (0=disable, 1=enable)
+14|Conditions To Be Available Backup Heaters|Conditions to be available Backup heaters (0=always enabled, 1=depends on Outdoor Air temperature
+16|Terminal 1-2-3 : Remote Controller|Terminal 1-2-3 : Remote Controller (0=disable, 1=enable)
+17|Terminal 4-5-6 : 3way Mixing Valve|Terminal 4-5-6 : 3way mixing valve (0=disable, 1=enable)
+18|Terminal 7-8 : DHW Tank Temperature Probe|Terminal 7-8 : DHW tank temperature probe (0=disable, 1=enable)
+19|Terminal 9-10 : Outdoor Air Temperature Probe|Terminal 9-10 : Outdoor air temperature probe (additional) (0=disable, 1=enable)
+20|Terminal 11-12 : Buffer Tank Temperature Probe|Terminal 11-12 : Buffer tank temperature probe (0=disable, 1=enable)
+21|Terminal 13-14 : Mix Water Temperature Probe|Terminal 13-14 : Mix Water temperature probe (0=disable, 1=enable)
+22|Terminal 15-16-32 : Rs485 Mod Bus|Terminal 15-16-32 : RS485 Mod Bus (0=disable, 1=enable)
+23|Terminal 17-18 : Humidity Sensor|Terminal 17-18 : Humidity sensor (0=disable, 1=enable)
+24|Terminal 19-18 : DHW Remote Contact|Terminal 19-18 : DHW remote contact (0=disable (Remote controller only), 1=enable)
+25|Terminal 22-23 : Dual Set Point Control|Terminal 22-23 : Dual set point control (0=disable, 1=enable)
+26|Terminal 26-27 : Flow Switch|Terminal 26-27 : Flow switch (0=disable, 1=enable)
+27|Terminal 28-29 : Night Mode|Terminal 28-29 : Night mode (0=disable (Remote controller only), 1=enable)
+28|Terminal 30-31 : Low Tariff|Terminal 30-31 : Low tariff (0=disable (Remote controller only), 1=enable)
+29|Terminal 41-42 : EHS|Terminal 41-42 : EHS (External heat source for space heating) (0=disable, 1=enable)
+30|Terminal 43-44 : Heating/cooling Mode Output|Terminal 43-44 : Heating/Cooling mode output (0=disable, 1=Indication of Cooling mode (CLOSE=Cooling), 2=indication of Heating mode (CLOSE=Heating))
+31|Terminal 45 : Dehumidifier|Terminal 45 : Dehumidifier (0=disable, 1=enable)
+32|Terminal 46 : DHW Electric Heater Or Backup Heater|Terminal 46 : DHW Electric heater or Backup heater (0=DHW Electric heater, 1=Backup heater)
+"""
+
+_COIL_REGISTER_MAP_RAW = {}
+for _row in _COIL_REGISTERS_TABLE.splitlines():
+    _addr, _name, *_description = _row.split("|")
+    _COIL_REGISTER_MAP_RAW[int(_addr)] = {"name": _name, "description": "".join(_description)}
+
+
+def _make_spec(config: Mapping[str, Any]) -> RegSpec:
+    """Build a RegSpec from a literal entry, interning plain-string fields."""
+    spec = RegSpec(**{
+        # Enum members are already singletons; only plain str can be interned
+        key: sys.intern(value) if type(value) is str else value
+        for key, value in config.items()
+    })
+    # Entries whose description would only repeat the name omit it
+    if not spec.description:
+        spec = spec._replace(description=spec.name)
+    return spec
+
+
+def _freeze_register_map(
+    register_map: Mapping[int, Mapping[str, Any]],
+) -> Mapping[int, RegSpec]:
+    """Convert entries to RegSpec behind a read-only view."""
+    return MappingProxyType({
+        addr: _make_spec(config) for addr, config in register_map.items()
+    })
+
+
+INPUT_REGISTER_MAP: Final[Mapping[int, RegSpec]] = _freeze_register_map(
+    _INPUT_REGISTER_MAP_RAW
+)
+HOLDING_REGISTER_MAP: Final[Mapping[int, RegSpec]] = _freeze_register_map(
+    _HOLDING_REGISTER_MAP_RAW
+)
+COIL_REGISTER_MAP: Final[Mapping[int, RegSpec]] = _freeze_register_map(
+    _COIL_REGISTER_MAP_RAW
+)
+
+# The raw literals are only needed to build the frozen maps
+del _INPUT_REGISTER_MAP_RAW, _HOLDING_REGISTER_MAP_RAW, _COIL_REGISTER_MAP_RAW
+del _COIL_REGISTERS_TABLE, _row, _addr, _name, _description
+
+# Register sets shared by the installation templates below
+_STANDARD_INPUT = frozenset([*range(0, 21), 32])
+_STANDARD_HOLDING = frozenset([*range(2, 97), 99, 100])
+_STANDARD_COIL = frozenset(range(1, 33))
 
 # Installation Templates
 INSTALLATION_TEMPLATES = {
@@ -1287,9 +1178,9 @@ INSTALLATION_TEMPLATES = {
         "description": "Most common setup with one heating zone",
         "percentage": "65%",
         "enabled_registers": {
-            "input": list(range(0, 21)) + [32], 
-            "holding": list(range(2, 97)) + [99, 100], 
-            "coil": list(range(1, 33))
+            "input": _STANDARD_INPUT,
+            "holding": _STANDARD_HOLDING,
+            "coil": _STANDARD_COIL
         }
     },
     "dual_zone": {
@@ -1297,9 +1188,9 @@ INSTALLATION_TEMPLATES = {
         "description": "Upstairs/downstairs or separate zones",
         "percentage": "20%",
         "enabled_registers": {
-            "input": list(range(0, 21)) + [32], 
-            "holding": list(range(2, 97)) + [99, 100], 
-            "coil": list(range(1, 33))
+            "input": _STANDARD_INPUT,
+            "holding": _STANDARD_HOLDING,
+            "coil": _STANDARD_COIL
         }
     },
     "dhw_only": {
@@ -1307,9 +1198,9 @@ INSTALLATION_TEMPLATES = {
         "description": "Cylinder heating only",
         "percentage": "8%",
         "enabled_registers": {
-            "input": [0, 1, 2, 3, 6, 11, 21, 22, 26],
-            "holding": [],
-            "coil": [1, 6]
+            "input": frozenset({0, 1, 2, 3, 6, 11, 21, 22, 26}),
+            "holding": frozenset(),
+            "coil": frozenset({1, 6})
         }
     },
     "replacement": {
@@ -1317,9 +1208,9 @@ INSTALLATION_TEMPLATES = {
         "description": "Full system replacement",
         "percentage": "5%",
         "enabled_registers": {
-            "input": list(range(0, 33)),
-            "holding": list(range(2, 100)),
-            "coil": list(range(1, 34))
+            "input": frozenset(range(0, 33)),
+            "holding": frozenset(range(2, 100)),
+            "coil": frozenset(range(1, 34))
         }
     },
     "custom": {
@@ -1327,9 +1218,167 @@ INSTALLATION_TEMPLATES = {
         "description": "Advanced users - all registers",
         "percentage": "2%",
         "enabled_registers": {
-            "input": list(range(0, 21)) + [32], 
-            "holding": list(range(2, 97)) + [99, 100], 
-            "coil": list(range(1, 33))
+            "input": _STANDARD_INPUT,
+            "holding": _STANDARD_HOLDING,
+            "coil": _STANDARD_COIL
         }
     }
 }
+
+# Maximum number of registers a single Modbus read request may return
+MODBUS_MAX_READ_COUNT = 125
+# Maximum number of coils a single Modbus read coils request may return
+MODBUS_MAX_COIL_READ_COUNT = 2000
+# Unused coils the enhanced coordinator reads through rather than split a block
+COIL_READ_MAX_GAP = 8
+# Maximum number of registers / coils a single Modbus write request may carry
+MODBUS_MAX_WRITE_COUNT = 123
+MODBUS_MAX_COIL_WRITE_COUNT = 1968
+# Seconds the enhanced coordinator collects writes before sending them
+WRITE_BATCH_DELAY = 0.02
+
+
+def _compute_ranges(
+    register_map: Iterable[int], max_len: int = MODBUS_MAX_READ_COUNT
+) -> tuple[tuple[int, int], ...]:
+    """Group register addresses into contiguous (start, count) read spans."""
+    addresses = sorted(register_map)
+    if not addresses:
+        return ()
+
+    ranges = []
+    start = prev = addresses[0]
+    for addr in addresses[1:]:
+        if addr == prev + 1 and addr - start < max_len:
+            prev = addr
+        else:
+            ranges.append((start, prev - start + 1))
+            start = prev = addr
+    ranges.append((start, prev - start + 1))
+    return tuple(ranges)
+
+
+# Contiguous read spans, computed once at import
+INPUT_REGISTER_RANGES = _compute_ranges(INPUT_REGISTER_MAP)
+HOLDING_REGISTER_RANGES = _compute_ranges(HOLDING_REGISTER_MAP)
+COIL_REGISTER_RANGES = _compute_ranges(COIL_REGISTER_MAP)
+
+# Holding registers that accept writes
+WRITABLE_HOLDING_REGISTERS = frozenset(
+    addr for addr, spec in HOLDING_REGISTER_MAP.items() if spec.writable
+)
+
+
+def _register_columns(
+    register_map: Mapping[int, RegSpec],
+) -> tuple[tuple[int, ...], RegSpec]:
+    """Transpose a register map into address-ordered RegSpec field columns."""
+    addresses = tuple(sorted(register_map))
+    return addresses, RegSpec._make(zip(*(register_map[a] for a in addresses)))
+
+
+# Address-ordered field columns of the register maps; the scale and offset
+# columns feed the per-register decoders below
+INPUT_REGISTER_ADDRESSES, _INPUT_COLUMNS = _register_columns(INPUT_REGISTER_MAP)
+HOLDING_REGISTER_ADDRESSES, _HOLDING_COLUMNS = _register_columns(HOLDING_REGISTER_MAP)
+COIL_REGISTER_ADDRESSES = tuple(sorted(COIL_REGISTER_MAP))
+
+# Register address -> position in the address-ordered columns above
+_INPUT_ADDR_TO_IDX = MappingProxyType(
+    {addr: idx for idx, addr in enumerate(INPUT_REGISTER_ADDRESSES)}
+)
+_HOLDING_ADDR_TO_IDX = MappingProxyType(
+    {addr: idx for idx, addr in enumerate(HOLDING_REGISTER_ADDRESSES)}
+)
+
+
+def _data_keys(prefix: str, addresses: Iterable[int]) -> Mapping[int, str]:
+    """Map each register address to its interned coordinator data key."""
+    return MappingProxyType(
+        {addr: sys.intern(f"{prefix}_{addr}") for addr in addresses}
+    )
+
+
+# Register address -> key in the coordinator data, e.g. "input_3"; polling
+# and the entities share these string objects instead of formatting them
+INPUT_DATA_KEYS = _data_keys(INPUT_REGISTERS, INPUT_REGISTER_ADDRESSES)
+HOLDING_DATA_KEYS = _data_keys(HOLDING_REGISTERS, HOLDING_REGISTER_ADDRESSES)
+COIL_DATA_KEYS = _data_keys(COIL_REGISTERS, COIL_REGISTER_ADDRESSES)
+
+
+def _make_decoder(scale: float, offset: float) -> Callable[[int], Any]:
+    """Return a raw-to-value function specialised for one register's scaling."""
+    if scale == 1 and offset == 0:
+        return int
+    if offset == 0:
+        return lambda raw: raw * scale
+    return lambda raw: raw * scale + offset
+
+
+# Per-register decoders aligned with the address tuples above
+INPUT_REGISTER_DECODERS = tuple(
+    map(_make_decoder, _INPUT_COLUMNS.scale, _INPUT_COLUMNS.offset)
+)
+HOLDING_REGISTER_DECODERS = tuple(
+    map(_make_decoder, _HOLDING_COLUMNS.scale, _HOLDING_COLUMNS.offset)
+)
+
+# Polling tiers: live telemetry and the operating mode (which drives the
+# climate and heating/cooling entities) change every scan, while set points
+# and slow-moving tank/buffer temperatures can be refreshed less often
+FAST_INPUT_REGISTERS = frozenset({0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 32})
+SLOW_INPUT_REGISTERS = frozenset(INPUT_REGISTER_MAP) - FAST_INPUT_REGISTERS
+FAST_INPUT_RANGES = _compute_ranges(FAST_INPUT_REGISTERS)
+SLOW_INPUT_RANGES = _compute_ranges(SLOW_INPUT_REGISTERS)
+
+# Slow-tier registers (slow input, holding and coils) are read on every
+# Nth poll; the fast tier is read on every poll
+SLOW_POLL_INTERVAL = 10
+
+
+def _read_plan(
+    ranges: tuple[tuple[int, int], ...],
+    data_keys: Mapping[int, str],
+    addr_to_idx: Mapping[int, int],
+    decoders: tuple[Callable[[int], Any], ...],
+) -> tuple[tuple[int, int, tuple[str, ...], tuple[Callable[[int], Any], ...]], ...]:
+    """Pair each (start, count) read span with its data keys and decoders."""
+    return tuple(
+        (
+            start,
+            count,
+            tuple(data_keys[addr] for addr in range(start, start + count)),
+            decoders[addr_to_idx[start]:addr_to_idx[start] + count],
+        )
+        for start, count in ranges
+    )
+
+
+# (start, count, data keys, decoders) per block read by the coordinator
+FAST_INPUT_READ_PLAN = _read_plan(
+    FAST_INPUT_RANGES,
+    INPUT_DATA_KEYS,
+    _INPUT_ADDR_TO_IDX,
+    INPUT_REGISTER_DECODERS,
+)
+SLOW_INPUT_READ_PLAN = _read_plan(
+    SLOW_INPUT_RANGES,
+    INPUT_DATA_KEYS,
+    _INPUT_ADDR_TO_IDX,
+    INPUT_REGISTER_DECODERS,
+)
+HOLDING_READ_PLAN = _read_plan(
+    HOLDING_REGISTER_RANGES,
+    HOLDING_DATA_KEYS,
+    _HOLDING_ADDR_TO_IDX,
+    HOLDING_REGISTER_DECODERS,
+)
+# (start, count, data keys) per block of coils
+COIL_READ_PLAN = tuple(
+    (
+        start,
+        count,
+        tuple(COIL_DATA_KEYS[addr] for addr in range(start, start + count)),
+    )
+    for start, count in COIL_REGISTER_RANGES
+)
@@ -1,27 +1,116 @@
 """Data update coordinator for Grant Aerona3 Heat Pump."""
+import asyncio
 import logging
+from array import array
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from pymodbus.client import ModbusTcpClient
+from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
 from .const import (
     CONF_SCAN_INTERVAL,
     CONF_SLAVE_ID,
-    COIL_REGISTER_MAP,
+    COIL_READ_PLAN,
+    CONNECTION_TEST_ATTEMPTS,
+    CONNECTION_TEST_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
-    HOLDING_REGISTER_MAP,
-    INPUT_REGISTER_MAP,
+    FAST_INPUT_READ_PLAN,
+    HOLDING_READ_PLAN,
+    MANUFACTURER,
+    MODEL,
+    PENDING_CLIENT_TTL,
+    PENDING_CLIENTS,
+    SLOW_INPUT_READ_PLAN,
+    SLOW_POLL_INTERVAL,
+    WRITABLE_HOLDING_REGISTERS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Quiet window after the last write before refreshing, so a burst of
+# writes (e.g. dragging a setpoint slider) shares a single Modbus poll
+REQUEST_REFRESH_COOLDOWN = 0.5
+
+# Data keys read on every poll
+_FAST_INPUT_KEYS = frozenset(
+    key for _start, _count, keys, _decoders in FAST_INPUT_READ_PLAN for key in keys
+)
+
+
+def _new_client(host: str, port: int) -> AsyncModbusTcpClient:
+    """Create a Modbus client configured for polling."""
+    return AsyncModbusTcpClient(host=host, port=port, timeout=10)
+
+
+@callback
+def async_stash_pending_client(
+    hass: HomeAssistant, host: str, port: int, client: AsyncModbusTcpClient
+) -> None:
+    """Keep a tested, open client for the coordinator of the new entry."""
+    pending = hass.data.setdefault(DOMAIN, {}).setdefault(PENDING_CLIENTS, {})
+    key = (host, port)
+
+    # A repeated test (e.g. the user went back a step) replaces the old one
+    if (previous := pending.pop(key, None)) is not None:
+        previous[1]()
+        previous[0].close()
+
+    @callback
+    def _async_expire(_now: Any) -> None:
+        """Close the client if the flow was abandoned."""
+        if pending.get(key, (None,))[0] is client:
+            del pending[key]
+            client.close()
+
+    pending[key] = (client, async_call_later(hass, PENDING_CLIENT_TTL, _async_expire))
+
+
+@callback
+def _async_take_pending_client(
+    hass: HomeAssistant, host: str, port: int
+) -> AsyncModbusTcpClient | None:
+    """Claim the client left by the connection test, if it is still open."""
+    pending = hass.data.get(DOMAIN, {}).get(PENDING_CLIENTS)
+    if not pending or (entry := pending.pop((host, port), None)) is None:
+        return None
+    client, cancel_expiry = entry
+    cancel_expiry()
+    return client if client.connected else None
+
+
+@dataclass(slots=True, frozen=True)
+class RegisterReading:
+    """A single decoded register value from the heat pump."""
+
+    value: Any
+    raw_value: int | None = None
+
+
+def _decode_block(
+    data: dict[str, Any],
+    keys: tuple[str, ...],
+    registers: list[int],
+    decoders: tuple[Callable[[int], Any], ...],
+) -> None:
+    """Decode a contiguous block of 16-bit registers into data."""
+    # View the packed block as signed 16-bit without copying it (temperature
+    # can be negative), then decode it in lockstep with the plan's keys and
+    # decoders; these have one entry per requested register, so zip also
+    # drops any padding the device appended to the response
+    signed = memoryview(array("H", registers)).cast("B").cast("h")
+    for key, raw, raw_value, decode in zip(keys, registers, signed, decoders):
+        data[key] = RegisterReading(decode(raw_value), raw)
+
 
 class GrantAerona3Coordinator(DataUpdateCoordinator):
     """Grant Aerona3 data update coordinator."""
@@ -40,198 +129,266 @@ class GrantAerona3Coordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
 
-        self._client = ModbusTcpClient(
-            host=self.host,
-            port=self.port,
-            timeout=10
-        )
+        # Reuse the connection the config flow just tested, if any
+        self._client = _async_take_pending_client(
+            hass, self.host, self.port
+        ) or _new_client(self.host, self.port)
+        # The connection is kept open across polls and writes; only one
+        # caller at a time may (re)establish it
+        self._connect_lock = asyncio.Lock()
+        
+        # Position within the slow-tier cycle; 0 means a full refresh is due
+        self._polls_since_full_refresh = 0
+
+        # Device info shared by every entity of this config entry
+        self.device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": "Grant Aerona3 Heat Pump",
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+            "sw_version": "1.0.0",
+        }
+
+    @staticmethod
+    async def async_test_connection(
+        host: str, port: int, slave_id: int
+    ) -> AsyncModbusTcpClient:
+        """Connect and read one register, returning the open client.
+
+        Raises ModbusException if the device does not connect or answer.
+        """
+        client = _new_client(host, port)
+        try:
+            # Retry once with a fresh socket before giving up
+            for _ in range(CONNECTION_TEST_ATTEMPTS):
+                try:
+                    if await asyncio.wait_for(
+                        client.connect(), timeout=CONNECTION_TEST_TIMEOUT
+                    ):
+                        break
+                except (asyncio.TimeoutError, ModbusException) as err:
+                    _LOGGER.debug("Connection attempt to %s failed: %s", host, err)
+                client.close()
+            else:
+                raise ModbusException("Failed to connect to Modbus device")
+
+            # Try to read a register to verify communication
+            result = await asyncio.wait_for(
+                client.read_input_registers(address=0, count=1, slave=slave_id),
+                timeout=CONNECTION_TEST_TIMEOUT,
+            )
+            if result.isError():
+                raise ModbusException("Failed to read from Modbus device")
+        except BaseException:
+            client.close()
+            raise
+
+        return client
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the heat pump."""
         try:
-            return await self.hass.async_add_executor_job(self._fetch_data)
+            return await self._async_fetch_data()
         except Exception as err:
             raise UpdateFailed(f"Error communicating with heat pump: {err}") from err
 
-    def _fetch_data(self) -> dict[str, Any]:
-        """Fetch data from the heat pump (runs in executor)."""
-        data = {}
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch data from the heat pump."""
+        full_refresh = self._polls_since_full_refresh == 0 or not self.data
+        self._polls_since_full_refresh = (
+            self._polls_since_full_refresh + 1
+        ) % SLOW_POLL_INTERVAL
         
-        try:
-            if not self._client.connect():
-                raise ModbusException("Failed to connect to Modbus device")
+        if not await self._async_ensure_connected():
+            raise ModbusException("Failed to connect to Modbus device")
 
-            # Read input registers
-            input_data = self._read_input_registers()
-            data.update(input_data)
+        # Read fast-changing input registers
+        reads = [self._async_read_input_registers(FAST_INPUT_READ_PLAN)]
 
-            # Read holding registers
-            holding_data = self._read_holding_registers()
-            data.update(holding_data)
+        if full_refresh:
+            # Read slow-changing input registers, holding registers and coils
+            reads.append(self._async_read_input_registers(SLOW_INPUT_READ_PLAN))
+            reads.append(self._async_read_holding_registers())
+            reads.append(self._async_read_coil_registers())
 
-            # Read coil registers
-            coil_data = self._read_coil_registers()
-            data.update(coil_data)
+        # pymodbus sends one request at a time on the connection, so the
+        # register spaces are read in turn
+        fresh = {}
+        for read in reads:
+            fresh.update(await read)
 
-        finally:
+        # Nothing came back: drop the connection so the next poll
+        # starts from a fresh socket
+        if not fresh:
             self._client.close()
 
+        if full_refresh:
+            return fresh
+        
+        # Between full refreshes, slow-tier values carry over from the
+        # previous poll so their entities stay available; fast-tier values
+        # are never carried over, so a block that failed to read drops out
+        # instead of republishing its stale values
+        data = {
+            key: reading
+            for key, reading in self.data.items()
+            if key not in _FAST_INPUT_KEYS
+        }
+        data.update(fresh)
         return data
 
-    def _read_input_registers(self) -> dict[str, Any]:
-        """Read input registers."""
+    def _schedule_full_refresh(self) -> None:
+        """Make the next poll re-read every tier, e.g. after a write."""
+        self._polls_since_full_refresh = 0
+
+    async def _async_ensure_connected(self) -> bool:
+        """Reuse the open connection, reconnecting only if it was dropped."""
+        async with self._connect_lock:
+            return self._client.connected or await self._client.connect()
+
+    async def _async_read_input_registers(self, plan) -> dict[str, Any]:
+        """Read the input register blocks in plan."""
         data = {}
         
-        # Read all input registers in one go (0-18)
-        try:
-            result = self._client.read_input_registers(
-                address=0,
-                count=19,
-                slave=self.slave_id
-            )
-            
-            if result.isError():
-                _LOGGER.error("Error reading input registers: %s", result)
-                return data
+        # Read each contiguous block of mapped input registers in one request
+        for start, count, keys, decoders in plan:
+            try:
+                result = await self._client.read_input_registers(
+                    address=start,
+                    count=count,
+                    slave=self.slave_id
+                )
                 
-            for addr, config in INPUT_REGISTER_MAP.items():
-                if addr < len(result.registers):
-                    raw_value = result.registers[addr]
-                    
-                    # Handle signed values (temperature can be negative)
-                    if raw_value > 32767:
-                        raw_value = raw_value - 65536
+                if result.isError():
+                    _LOGGER.error(
+                        "Error reading input registers %s-%s: %s",
+                        start, start + count - 1, result
+                    )
+                    continue
                     
-                    # Apply scaling
-                    scaled_value = raw_value * config["scale"]
+                _decode_block(data, keys, result.registers, decoders)
                     
-                    data[f"input_{addr}"] = {
-                        "value": scaled_value,
-                        "raw_value": result.registers[addr],
-                        "name": config["name"],
-                        "unit": config["unit"],
-                        "device_class": config["device_class"]
-                    }
-                    
-        except Exception as err:
-            _LOGGER.error("Error reading input registers: %s", err)
+            except Exception as err:
+                _LOGGER.error(
+                    "Error reading input registers %s-%s: %s",
+                    start, start + count - 1, err
+                )
             
         return data
 
-    def _read_holding_registers(self) -> dict[str, Any]:
+    async def _async_read_holding_registers(self) -> dict[str, Any]:
         """Read holding registers."""
         data = {}
         
-        # Read holding registers for setpoints
-        for addr, config in HOLDING_REGISTER_MAP.items():
+        # Read each contiguous block of setpoint registers in one request
+        for start, count, keys, decoders in HOLDING_READ_PLAN:
             try:
-                result = self._client.read_holding_registers(
-                    address=addr,
-                    count=1,
+                result = await self._client.read_holding_registers(
+                    address=start,
+                    count=count,
                     slave=self.slave_id
                 )
                 
-                if not result.isError():
-                    raw_value = result.registers[0]
-                    
-                    # Handle signed values
-                    if raw_value > 32767:
-                        raw_value = raw_value - 65536
-                    
-                    # Apply scaling
-                    scaled_value = raw_value * config["scale"]
-                    
-                    data[f"holding_{addr}"] = {
-                        "value": scaled_value,
-                        "raw_value": result.registers[0],
-                        "name": config["name"],
-                        "unit": config["unit"],
-                        "min": config["min"],
-                        "max": config["max"]
-                    }
+                if result.isError():
+                    _LOGGER.error(
+                        "Error reading holding registers %s-%s: %s",
+                        start, start + count - 1, result
+                    )
+                    continue
+                
+                _decode_block(data, keys, result.registers, decoders)
                     
             except Exception as err:
-                _LOGGER.error("Error reading holding register %s: %s", addr, err)
+                _LOGGER.error(
+                    "Error reading holding registers %s-%s: %s",
+                    start, start + count - 1, err
+                )
                 
         return data
 
-    def _read_coil_registers(self) -> dict[str, Any]:
+    async def _async_read_coil_registers(self) -> dict[str, Any]:
         """Read coil registers."""
         data = {}
         
-        # Read coil registers for switches
-        for addr, config in COIL_REGISTER_MAP.items():
+        # Read each contiguous block of switch coils in one request
+        for start, count, keys in COIL_READ_PLAN:
             try:
-                result = self._client.read_coils(
-                    address=addr,
-                    count=1,
+                result = await self._client.read_coils(
+                    address=start,
+                    count=count,
                     slave=self.slave_id
                 )
                 
-                if not result.isError():
-                    data[f"coil_{addr}"] = {
-                        "value": result.bits[0],
-                        "name": config["name"],
-                        "description": config["description"]
-                    }
+                if result.isError():
+                    _LOGGER.error(
+                        "Error reading coil registers %s-%s: %s",
+                        start, start + count - 1, result
+                    )
+                    continue
+                
+                # Bits are padded to a whole byte; zip stops at the span
+                for key, bit in zip(keys, result.bits):
+                    data[key] = RegisterReading(bit)
                     
             except Exception as err:
-                _LOGGER.error("Error reading coil register %s: %s", addr, err)
+                _LOGGER.error(
+                    "Error reading coil registers %s-%s: %s",
+                    start, start + count - 1, err
+                )
                 
         return data
 
+    async def _async_write(self, write, address: int, **kwargs: Any) -> bool:
+        """Send a write request over the shared connection."""
+        if not await self._async_ensure_connected():
+            return False
+        
+        try:
+            result = await write(address=address, slave=self.slave_id, **kwargs)
+        except Exception:
+            # Drop a broken connection so the next call reconnects
+            self._client.close()
+            raise
+        
+        if result.isError():
+            return False
+        
+        self._schedule_full_refresh()
+        return True
+
     async def async_write_holding_register(self, address: int, value: int) -> bool:
         """Write to a holding register."""
+        if address not in WRITABLE_HOLDING_REGISTERS:
+            _LOGGER.error("Holding register %s is not writable", address)
+            return False
+
         try:
-            return await self.hass.async_add_executor_job(
-                self._write_holding_register, address, value
+            return await self._async_write(
+                self._client.write_register, address, value=value
             )
         except Exception as err:
             _LOGGER.error("Error writing holding register %s: %s", address, err)
             return False
 
-    def _write_holding_register(self, address: int, value: int) -> bool:
-        """Write to a holding register (runs in executor)."""
-        try:
-            if not self._client.connect():
-                return False
-                
-            result = self._client.write_register(
-                address=address,
-                value=value,
-                slave=self.slave_id
-            )
-            
-            return not result.isError()
-            
-        finally:
-            self._client.close()
-
     async def async_write_coil(self, address: int, value: bool) -> bool:
         """Write to a coil register."""
         try:
-            return await self.hass.async_add_executor_job(
-                self._write_coil, address, value
+            return await self._async_write(
+                self._client.write_coil, address, value=value
             )
         except Exception as err:
             _LOGGER.error("Error writing coil register %s: %s", address, err)
             return False
 
-    def _write_coil(self, address: int, value: bool) -> bool:
-        """Write to a coil register (runs in executor)."""
-        try:
-            if not self._client.connect():
-                return False
-                
-            result = self._client.write_coil(
-                address=address,
-                value=value,
-                slave=self.slave_id
-            )
-            
-            return not result.isError()
-            
-        finally:
-            self._client.close()
\ No newline at end of file
+    async def async_shutdown(self) -> None:
+        """Stop polling and close the Modbus connection."""
+        await super().async_shutdown()
+        self._client.close()
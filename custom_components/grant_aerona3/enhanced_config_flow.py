@@ -1,9 +1,13 @@
 """Enhanced config flow for Grant Aerona3 Heat Pump integration."""
 from __future__ import annotations
 
+import asyncio
+import ipaddress
 import logging
-import re
-from typing import Any, Dict, Optional
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -11,7 +15,8 @@ from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-from pymodbus.client import ModbusTcpClient
+from homeassistant.util import dt as dt_util
+from pymodbus.exceptions import ModbusException
 
 from .const import (
     CONF_SCAN_INTERVAL,
@@ -21,29 +26,39 @@ from .const import (
     DEFAULT_SLAVE_ID,
     DOMAIN,
 )
+from .coordinator import GrantAerona3Coordinator, async_stash_pending_client
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _freeze(value: Any) -> Any:
+    """Return a read-only view of a nested config mapping."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a mutable deep copy of a frozen config mapping."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+@dataclass(slots=True, frozen=True)
 class InstallationTemplate:
     """Installation template for Grant Aerona3 configurations."""
-    
-    def __init__(
-        self,
-        template_id: str,
-        name: str,
-        description: str,
-        percentage: str,
-        common: bool,
-        default_config: Dict[str, Any]
-    ):
-        """Initialize installation template."""
-        self.template_id = template_id
-        self.name = name
-        self.description = description
-        self.percentage = percentage
-        self.common = common
-        self.default_config = default_config
+
+    template_id: str
+    name: str
+    description: str
+    percentage: str
+    common: bool
+    default_config: Mapping[str, Any]
+
+    def __post_init__(self) -> None:
+        """Freeze the default config, which is shared by every flow."""
+        object.__setattr__(self, "default_config", _freeze(self.default_config))
 
 
 # Installation templates based on Grant Aerona3 common configurations
@@ -132,40 +147,76 @@ INSTALLATION_TEMPLATES = {
     )
 }
 
+# Installation type selection, labelled once from the templates
+INSTALLATION_OPTIONS = {
+    template_id: f"{template.name} ({template.percentage}) - {template.description}"
+    for template_id, template in INSTALLATION_TEMPLATES.items()
+}
 
-async def validate_connection(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate the user input allows us to connect."""
+STEP_USER_SCHEMA = vol.Schema({
+    vol.Required("installation_type"): vol.In(INSTALLATION_OPTIONS)
+})
+
+
+# Connection details schema
+STEP_CONNECTION_SCHEMA = vol.Schema({
+    vol.Required(CONF_HOST): str,
+    vol.Optional(CONF_PORT, default=DEFAULT_PORT): vol.All(
+        int, vol.Range(min=1, max=65535)
+    ),
+    vol.Optional(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): vol.All(
+        int, vol.Range(min=1, max=247)
+    ),
+    vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
+})
+
+
+def _build_verification_schema(template_config: Mapping[str, Any]) -> vol.Schema:
+    """Build the system verification schema for an installation template."""
+    zone_2_enabled = template_config.get("zones", {}).get("zone_2", {}).get("enabled", False)
+    dhw_cylinder = template_config.get("dhw_cylinder", False)
+
+    schema_dict = {}
     
-    def _test_connection():
-        """Test connection to the Modbus device."""
-        client = ModbusTcpClient(
-            host=data[CONF_HOST],
-            port=data[CONF_PORT],
-            timeout=10
-        )
-        
-        try:
-            if not client.connect():
-                raise CannotConnect("Failed to connect to Modbus device")
-            
-            # Try to read a register to verify communication
-            result = client.read_input_registers(
-                address=0,
-                count=1,
-                slave=data[CONF_SLAVE_ID]
-            )
-            
-            if result.isError():
-                raise CannotConnect("Failed to read from Modbus device")
-                
-            return True
-            
-        finally:
-            client.close()
+    # Always include zone configuration
+    schema_dict[vol.Optional("zone_1_name", default="Main Zone")] = str
+    schema_dict[vol.Optional("zone_2_enabled", default=zone_2_enabled)] = bool
+    schema_dict[vol.Optional("zone_2_name", default="Second Zone")] = str
+    
+    # DHW configuration
+    schema_dict[vol.Optional("dhw_cylinder", default=dhw_cylinder)] = bool
     
-    # Test connection in executor to avoid blocking
-    await hass.async_add_executor_job(_test_connection)
+    if dhw_cylinder:
+        schema_dict[vol.Optional("dhw_cylinder_size", default="250L")] = vol.In([
+            "180L", "210L", "250L", "300L", "Custom"
+        ])
+        
+    # Backup heater
+    schema_dict[vol.Optional("backup_heater", default=template_config.get("backup_heater", False))] = bool
     
+    return vol.Schema(schema_dict)
+
+
+# Templates are fixed, so their verification forms are built once at import
+_VERIFICATION_SCHEMAS: Mapping[str, vol.Schema] = MappingProxyType({
+    template_id: _build_verification_schema(template.default_config)
+    for template_id, template in INSTALLATION_TEMPLATES.items()
+})
+
+
+async def validate_connection(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+    """Validate the user input allows us to connect."""
+    host, port = data[CONF_HOST], data[CONF_PORT]
+    try:
+        client = await GrantAerona3Coordinator.async_test_connection(
+            host, port, data[CONF_SLAVE_ID]
+        )
+    except (ModbusException, OSError, asyncio.TimeoutError) as err:
+        raise CannotConnect(f"Failed to connect to Modbus device: {err}") from err
+
+    # Hand the open connection to the coordinator instead of reconnecting
+    async_stash_pending_client(hass, host, port, client)
+
     # Return info that you want to store in the config entry.
     return {"title": f"Grant Aerona3 ({data[CONF_HOST]})"}
 
@@ -177,76 +228,25 @@ class GrantAerona3EnhancedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self):
         """Initialize config flow."""
-        self._config_data = {}
-        self._selected_template = None
+        self._config_data: dict[str, Any] = {}
+        self._selected_template: InstallationTemplate | None = None
     
-    def _sanitize_user_input(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
-        """Sanitize user input to prevent injection attacks."""
-        sanitized = {}
-        
-        for key, value in user_input.items():
-            if isinstance(value, str):
-                # Remove potentially dangerous characters for security
-                sanitized_value = re.sub(r'[<>"\';\\]', '', value.strip())
-                # Additional validation for specific fields
-                if key == CONF_HOST:
-                    # Validate IP address format
-                    if not re.match(r'^(\d{1,3}\.){3}\d{1,3}$', sanitized_value):
-                        raise ValueError(f"Invalid IP address format: {sanitized_value}")
-                elif key == CONF_PORT:
-                    # Port should be numeric
-                    if not isinstance(value, int) or not (1 <= value <= 65535):
-                        raise ValueError(f"Invalid port number: {value}")
-                elif key == CONF_SLAVE_ID:
-                    # Slave ID should be between 1-247
-                    if not isinstance(value, int) or not (1 <= value <= 247):
-                        raise ValueError(f"Invalid Slave ID: {value}")
-                sanitized[key] = sanitized_value
-            elif isinstance(value, (int, float, bool)):
-                # Numeric and boolean values are generally safe
-                sanitized[key] = value
-            elif isinstance(value, dict):
-                # Recursively sanitize nested dictionaries
-                sanitized[key] = self._sanitize_user_input(value)
-            else:
-                # For other types, convert to string and sanitize
-                sanitized[key] = re.sub(r'[<>"\';\\]', '', str(value))
-                
-        return sanitized
-
     async def async_step_user(
-        self, user_input: Dict[str, Any] | None = None
+        self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step - installation type selection."""
-        errors: Dict[str, str] = {}
+        errors: dict[str, str] = {}
         
         if user_input is not None:
-            try:
-                # Sanitize user input for security
-                sanitized_input = self._sanitize_user_input(user_input)
-                template_id = sanitized_input.get("installation_type")
-                if template_id in INSTALLATION_TEMPLATES:
-                    self._selected_template = INSTALLATION_TEMPLATES[template_id]
-                    return await self.async_step_connection()
-                else:
-                    errors["base"] = "invalid_template"
-            except ValueError as err:
-                _LOGGER.error("Input validation error: %s", err)
-                errors["base"] = "invalid_input"
-
-        # Create schema for installation type selection
-        installation_options = {}
-        for template_id, template in INSTALLATION_TEMPLATES.items():
-            label = f"{template.name} ({template.percentage}) - {template.description}"
-            installation_options[template_id] = label
-
-        schema = vol.Schema({
-            vol.Required("installation_type"): vol.In(installation_options)
-        })
+            template_id = user_input.get("installation_type")
+            if template_id in INSTALLATION_TEMPLATES:
+                self._selected_template = INSTALLATION_TEMPLATES[template_id]
+                return await self.async_step_connection()
+            errors["base"] = "invalid_template"
 
         return self.async_show_form(
             step_id="user",
-            data_schema=schema,
+            data_schema=STEP_USER_SCHEMA,
             errors=errors,
             description_placeholders={
                 "common_setups": "Most common Grant Aerona3 installations",
@@ -255,24 +255,28 @@ class GrantAerona3EnhancedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     async def async_step_connection(
-        self, user_input: Dict[str, Any] | None = None
+        self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle connection configuration."""
-        errors: Dict[str, str] = {}
+        errors: dict[str, str] = {}
         
         if user_input is not None:
+            user_input = {**user_input, CONF_HOST: user_input[CONF_HOST].strip()}
             try:
-                # Sanitize user input for security
-                sanitized_input = self._sanitize_user_input(user_input)
+                # Port and slave ID were range-checked by STEP_CONNECTION_SCHEMA
+                ipaddress.ip_address(user_input[CONF_HOST])
+            except ValueError:
+                errors[CONF_HOST] = "invalid_host"
                 
-                # Validate connection
-                await validate_connection(self.hass, sanitized_input)
+        if user_input is not None and not errors:
+            try:
+                await validate_connection(self.hass, user_input)
                 
                 # Store connection data
-                self._config_data.update(sanitized_input)
+                self._config_data.update(user_input)
                 
                 # Check if already configured
-                await self.async_set_unique_id(sanitized_input[CONF_HOST])
+                await self.async_set_unique_id(user_input[CONF_HOST])
                 self._abort_if_unique_id_configured()
                 
                 return await self.async_step_system_verification()
@@ -283,16 +287,9 @@ class GrantAerona3EnhancedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception during connection test")
                 errors["base"] = "unknown"
 
-        schema = vol.Schema({
-            vol.Required(CONF_HOST): str,
-            vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
-            vol.Optional(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): int,
-            vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
-        })
-
         return self.async_show_form(
             step_id="connection",
-            data_schema=schema,
+            data_schema=STEP_CONNECTION_SCHEMA,
             errors=errors,
             description_placeholders={
                 "template_name": self._selected_template.name,
@@ -301,10 +298,10 @@ class GrantAerona3EnhancedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     async def async_step_system_verification(
-        self, user_input: Dict[str, Any] | None = None
+        self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle system component verification."""
-        errors: Dict[str, str] = {}
+        errors: dict[str, str] = {}
         
         if user_input is not None:
             # Update config with verified components
@@ -313,33 +310,7 @@ class GrantAerona3EnhancedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Move to flow rate configuration
             return await self.async_step_flow_rate()
 
-        # Create schema based on selected template
-        template_config = self._selected_template.default_config
-        
-        schema_dict = {}
-        
-        # Always include zone configuration
-        schema_dict[vol.Optional("zone_1_name", default="Main Zone")] = str
-        
-        if template_config.get("zones", {}).get("zone_2", {}).get("enabled", False):
-            schema_dict[vol.Optional("zone_2_enabled", default=True)] = bool
-            schema_dict[vol.Optional("zone_2_name", default="Second Zone")] = str
-        else:
-            schema_dict[vol.Optional("zone_2_enabled", default=False)] = bool
-            schema_dict[vol.Optional("zone_2_name", default="Second Zone")] = str
-        
-        # DHW configuration
-        schema_dict[vol.Optional("dhw_cylinder", default=template_config.get("dhw_cylinder", False))] = bool
-        
-        if template_config.get("dhw_cylinder", False):
-            schema_dict[vol.Optional("dhw_cylinder_size", default="250L")] = vol.In([
-                "180L", "210L", "250L", "300L", "Custom"
-            ])
-            
-        # Backup heater
-        schema_dict[vol.Optional("backup_heater", default=template_config.get("backup_heater", False))] = bool
-        
-        schema = vol.Schema(schema_dict)
+        schema = _VERIFICATION_SCHEMAS[self._selected_template.template_id]
 
         return self.async_show_form(
             step_id="system_verification",
@@ -352,10 +323,10 @@ class GrantAerona3EnhancedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     async def async_step_flow_rate(
-        self, user_input: Dict[str, Any] | None = None
+        self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle flow rate configuration."""
-        errors: Dict[str, str] = {}
+        errors: dict[str, str] = {}
         
         if user_input is not None:
             # Update config with flow rate settings
@@ -391,10 +362,11 @@ class GrantAerona3EnhancedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }
         )
 
-    def _create_final_config(self) -> Dict[str, Any]:
+    def _create_final_config(self) -> dict[str, Any]:
         """Create final configuration from collected data."""
-        # Start with template defaults
-        final_config = self._selected_template.default_config.copy()
+        # Start with a private copy of the template defaults; the nested
+        # zone dicts are edited below
+        final_config = _thaw(self._selected_template.default_config)
         
         # Update with connection settings
         final_config.update({
@@ -436,7 +408,7 @@ class GrantAerona3EnhancedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         final_config.update({
             "installation_template": self._selected_template.template_id,
             "config_version": 2,
-            "setup_date": self.hass.helpers.utcnow().isoformat()
+            "setup_date": dt_util.utcnow().isoformat()
         })
         
         return final_config
@@ -456,10 +428,10 @@ class GrantAerona3OptionsFlow(config_entries.OptionsFlow):
         self.config_entry = config_entry
 
     async def async_step_init(
-        self, user_input: Dict[str, Any] | None = None
+        self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
-        errors: Dict[str, str] = {}
+        errors: dict[str, str] = {}
         
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
@@ -3,22 +3,35 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from collections import defaultdict, deque
+import math
+import time
+from array import array
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Mapping, Optional
+from collections import defaultdict
+from dataclasses import dataclass
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from pymodbus.client import ModbusTcpClient
+from homeassistant.util import dt as dt_util
+from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
 from .const import (
+    COIL_READ_MAX_GAP,
     CONF_SCAN_INTERVAL,
     CONF_SLAVE_ID,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MANUFACTURER,
+    MODBUS_MAX_COIL_READ_COUNT,
+    MODBUS_MAX_COIL_WRITE_COUNT,
+    MODBUS_MAX_READ_COUNT,
+    MODBUS_MAX_WRITE_COUNT,
+    MODEL,
+    WRITE_BATCH_DELAY,
 )
 from .register_manager import (
     GrantAerona3RegisterManager,
@@ -30,6 +43,108 @@ from .weather_compensation import WeatherCompensationController
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _ReadStats:
+    """Running read-time statistics for one register."""
+
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = 0.0
+
+    def add(self, duration: float) -> None:
+        """Record one read duration."""
+        self.count += 1
+        self.total += duration
+        if duration < self.minimum:
+            self.minimum = duration
+        if duration > self.maximum:
+            self.maximum = duration
+
+
+def _to_int16(registers: List[int]) -> array:
+    """Reinterpret unsigned register words as signed 16-bit values.
+
+    Registers are signed (temperatures can be negative); viewing the
+    words' bytes as int16 converts a whole block in one C-level pass.
+    """
+    return array("h", array("H", registers).tobytes())
+
+
+def _block_values(register_type: RegisterType, result) -> Any:
+    """Return a read result's values: coil bits or signed register words."""
+    if register_type is RegisterType.COIL:
+        return result.bits
+    return _to_int16(result.registers)
+
+
+def _make_register_processor(
+    register_config,
+) -> Callable[[int, str], Optional[Dict[str, Any]]]:
+    """Specialise raw value processing for one input or holding register."""
+    scale = register_config.scale
+    low = register_config.effective_min
+    high = register_config.effective_max
+    enum_mapping = register_config.enum_mapping or None
+    name = register_config.name
+    # Most registers read the same value poll after poll; the fields built
+    # for the previous raw value are reused in a fresh entry, so snapshots
+    # already published in coordinator.data never change
+    last_raw = None
+    last_entry = None
+
+    def process(raw_value: int, timestamp: str) -> Optional[Dict[str, Any]]:
+        """Process a signed raw register value according to configuration."""
+        nonlocal last_raw, last_entry
+        if raw_value == last_raw:
+            if last_entry is None:
+                return None
+            return {**last_entry, "timestamp": timestamp}
+        last_raw = raw_value
+        last_entry = None
+        
+        # Apply scaling
+        scaled_value = raw_value * scale
+        
+        # Validate value
+        if not low <= scaled_value <= high:
+            _LOGGER.warning(
+                "Invalid value for register %s: %f (raw: %d)",
+                name, scaled_value, raw_value
+            )
+            return None
+        
+        # Apply enum mapping if available
+        display_value = scaled_value
+        if enum_mapping is not None and raw_value in enum_mapping:
+            display_value = enum_mapping[raw_value]
+        
+        last_entry = {
+            "value": scaled_value,
+            "display_value": display_value,
+            "raw_value": raw_value,
+            "timestamp": timestamp
+        }
+        return last_entry
+
+    return process
+
+
+def _process_coil(value: bool, timestamp: str) -> Dict[str, Any]:
+    """Build the data entry for a coil value."""
+    return {
+        "value": value,
+        "timestamp": timestamp
+    }
+
+
+def _fail_writes(futures) -> None:
+    """Resolve write futures that are still pending as failed."""
+    for future in futures:
+        if not future.done():
+            future.set_result(False)
+
+
 class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
     """Enhanced Grant Aerona3 data update coordinator with register management."""
 
@@ -48,6 +163,7 @@ class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
         )
+        self._update_interval_secs = float(scan_interval)
 
         # Initialize register manager
         self.register_manager = GrantAerona3RegisterManager(entry.data)
@@ -55,25 +171,52 @@ class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
         # Initialize weather compensation controller
         self.weather_compensation = WeatherCompensationController(hass, self, entry.data)
         
-        # Modbus client
-        self._client = ModbusTcpClient(
+        # Modbus client. The connection is kept open across polls and
+        # writes; the async client is not reentrant, so only one of them
+        # may use it at a time. A dropped connection is re-established by
+        # pymodbus in the background, so a failed request fails the poll
+        # quickly and the next scheduled poll picks up the new socket
+        self._client = AsyncModbusTcpClient(
             host=self.host,
             port=self.port,
-            timeout=10
+            timeout=2,
+            retries=0,
+            reconnect_delay=0.2,
+            reconnect_delay_max=5,
         )
+        self._readers = {
+            RegisterType.INPUT: self._client.read_input_registers,
+            RegisterType.HOLDING: self._client.read_holding_registers,
+            RegisterType.COIL: self._client.read_coils,
+        }
+        self._client_lock = asyncio.Lock()
+        
+        # Writes are queued and sent in batches, see _async_flush_writes
+        self._write_queue: asyncio.Queue = asyncio.Queue()
+        self._write_task: Optional[asyncio.Task] = None
+        
+        # Device info shared by every entity of this config entry
+        self.device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": "Grant Aerona3 Heat Pump",
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+            "sw_version": "2.0.0",
+        }
         
         # Performance tracking with memory management
-        self._read_performance = defaultdict(lambda: deque(maxlen=100))  # Limited to 100 entries
-        self._error_counts = defaultdict(int)
-        self._last_successful_read = {}
-        self._max_error_count = 1000  # Prevent unbounded growth
+        self._read_performance = defaultdict(_ReadStats)  # Constant size per register
+        self._error_counts: Dict[str, int] = {}
+        self._last_successful_read = {}  # Pruned to the current block plan
+        self._max_error_count = 1000  # Distinct error keys kept, see _count_error
         
         # Connection management
         self._connection_errors = 0
         self._max_connection_errors = 5
         
-        # Data validation
-        self._data_validator = DataValidator()
+        # Block read plan, built on first poll; the enabled register set
+        # is fixed for the register manager's lifetime
+        self._read_plan: Optional[tuple] = None
         
         # Weather compensation setup flag
         self._weather_compensation_initialized = False
@@ -95,222 +238,234 @@ class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from the heat pump."""
         try:
-            return await self.hass.async_add_executor_job(self._fetch_data)
+            return await self._async_fetch_data()
         except Exception as err:
             self._connection_errors += 1
             if self._connection_errors >= self._max_connection_errors:
                 _LOGGER.error(
                     "Too many connection errors (%d), will retry in %d seconds",
                     self._connection_errors,
-                    self.update_interval.total_seconds()
+                    self._update_interval_secs
                 )
             raise UpdateFailed(f"Error communicating with heat pump: {err}") from err
 
-    def _fetch_data(self) -> Dict[str, Any]:
-        """Fetch data from the heat pump (runs in executor)."""
+    async def _async_fetch_data(self) -> Dict[str, Any]:
+        """Fetch data from the heat pump."""
         data = {}
-        start_time = datetime.now()
+        start_time = time.monotonic()
+        # Every value read in this poll shares one timestamp, in UTC as
+        # Home Assistant keeps its own
+        timestamp = dt_util.utcnow().isoformat()
         
-        try:
-            if not self._client.connect():
+        async with self._client_lock:
+            if not await self._async_ensure_connected():
                 raise ModbusException("Failed to connect to Modbus device")
 
-            # Read input registers
-            input_data = self._read_input_registers_enhanced()
-            data.update(input_data)
-
-            # Read holding registers
-            holding_data = self._read_holding_registers_enhanced()
-            data.update(holding_data)
-
-            # Read coil registers
-            coil_data = self._read_coil_registers_enhanced()
-            data.update(coil_data)
-            
-            # Add metadata
-            data["_metadata"] = {
-                "fetch_duration": (datetime.now() - start_time).total_seconds(),
-                "timestamp": datetime.now().isoformat(),
-                "enabled_registers": len(self.register_manager._enabled_registers),
-                "connection_errors": self._connection_errors
-            }
+            # pymodbus sends one request at a time on the connection, so
+            # the register spaces are read in turn
+            for lane in self._get_read_plan():
+                data.update(await self._async_read_lane(lane, timestamp))
             
-            # Reset connection error count on successful read
-            self._connection_errors = 0
-
-        finally:
-            self._client.close()
+        # Add metadata
+        data["_metadata"] = {
+            "fetch_duration": time.monotonic() - start_time,
+            "timestamp": timestamp,
+            "enabled_registers": len(self.register_manager._enabled_registers),
+            "connection_errors": self._connection_errors
+        }
+        
+        # Reset connection error count on successful read
+        self._connection_errors = 0
 
         return data
 
-    def _read_input_registers_enhanced(self) -> Dict[str, Any]:
-        """Read input registers using register manager."""
+    async def _async_ensure_connected(self) -> bool:
+        """Reuse the open connection, reconnecting only if it was dropped.
+
+        asyncio enables TCP_NODELAY on the sockets it opens, so small
+        requests are not held back by Nagle's algorithm.
+        """
+        return self._client.connected or await self._client.connect()
+
+    async def _async_read_lane(self, lane: tuple, timestamp: str) -> Dict[str, Any]:
+        """Read one register type's blocks in address order."""
         data = {}
-        enabled_registers = self.register_manager.get_enabled_registers(RegisterType.INPUT)
-        
-        if not enabled_registers:
-            return data
-            
-        # Group registers by contiguous blocks for efficient reading
-        register_blocks = self._group_registers_into_blocks(enabled_registers)
+        read_performance = self._read_performance
         
-        for start_addr, count in register_blocks:
+        for register_type, start_addr, count, members in lane:
             try:
-                read_start = datetime.now()
-                result = self._client.read_input_registers(
+                read_start = time.monotonic()
+                result = await self._readers[register_type](
                     address=start_addr,
                     count=count,
                     slave=self.slave_id
                 )
-                read_duration = (datetime.now() - read_start).total_seconds()
-                
-                if result.isError():
-                    _LOGGER.error("Error reading input registers %d-%d: %s", 
-                                start_addr, start_addr + count - 1, result)
-                    self._error_counts[f"input_{start_addr}"] += 1
-                    continue
-                    
-                # Process each register in the block
-                for register_id, register_config in enabled_registers.items():
-                    if start_addr <= register_config.address < start_addr + count:
-                        offset = register_config.address - start_addr
-                        raw_value = result.registers[offset]
-                        
-                        # Process the register value
-                        processed_data = self._process_register_value(
-                            register_config, raw_value
-                        )
-                        
-                        if processed_data:
-                            data[register_id] = processed_data
-                            
-                        # Track performance
-                        self._read_performance[register_id].append(read_duration)
-                        
-                # Store successful read for fallback
-                self._last_successful_read[f"input_{start_addr}"] = result.registers
-                        
+                read_duration = time.monotonic() - read_start
+                error = result if result.isError() else None
             except Exception as err:
-                _LOGGER.error("Error reading input register block %d-%d: %s", 
-                            start_addr, start_addr + count - 1, err)
-                self._error_counts[f"input_{start_addr}"] += 1
+                error = err
                 
-                # Use cached data if available
-                cached_data = self._get_cached_data_for_block(
-                    start_addr, count, enabled_registers, RegisterType.INPUT
+            if error is not None:
+                _LOGGER.warning(
+                    "Error reading %s registers %d-%d: %s",
+                    register_type.value, start_addr, start_addr + count - 1, error
                 )
-                data.update(cached_data)
+                self._count_error(f"{register_type.value}_{start_addr}")
+                
+                if register_type is RegisterType.INPUT:
+                    # Use cached data if available
+                    data.update(self._get_cached_data_for_block(
+                        start_addr, members, register_type, timestamp
+                    ))
+                else:
+                    data.update(await self._async_read_individually(
+                        register_type, members, timestamp
+                    ))
+                continue
+                
+            # Process each register in the block
+            values = _block_values(register_type, result)
+            for register_id, _, offset, process in members:
+                processed_data = process(values[offset], timestamp)
+                
+                if processed_data:
+                    data[register_id] = processed_data
+                    
+                # Track performance
+                read_performance[register_id].add(read_duration)
+                
+            if register_type is RegisterType.INPUT:
+                # Store successful read for fallback
+                self._last_successful_read[f"input_{start_addr}"] = values
                 
         return data
 
-    def _read_holding_registers_enhanced(self) -> Dict[str, Any]:
-        """Read holding registers using register manager."""
+    async def _async_read_individually(
+        self, register_type: RegisterType, members: tuple, timestamp: str
+    ) -> Dict[str, Any]:
+        """Read a block's registers one at a time, e.g. after the block read failed."""
         data = {}
-        enabled_registers = self.register_manager.get_enabled_registers(RegisterType.HOLDING)
+        read = self._readers[register_type]
         
-        # Read holding registers individually due to potential gaps
-        for register_id, register_config in enabled_registers.items():
+        for register_id, register_config, _, process in members:
             try:
-                result = self._client.read_holding_registers(
+                result = await read(
                     address=register_config.address,
                     count=1,
                     slave=self.slave_id
                 )
                 
                 if not result.isError():
-                    raw_value = result.registers[0]
-                    processed_data = self._process_register_value(
-                        register_config, raw_value
+                    processed_data = process(
+                        _block_values(register_type, result)[0], timestamp
                     )
                     
                     if processed_data:
                         data[register_id] = processed_data
                         
                 else:
-                    _LOGGER.error("Error reading holding register %s (addr %d): %s",
-                                register_id, register_config.address, result)
-                    self._error_counts[f"holding_{register_config.address}"] += 1
+                    _LOGGER.error("Error reading %s register %s (addr %d): %s",
+                                register_type.value, register_id,
+                                register_config.address, result)
+                    self._count_error(f"{register_type.value}_{register_config.address}")
                     
             except Exception as err:
-                _LOGGER.error("Error reading holding register %s: %s", register_id, err)
-                self._error_counts[f"holding_{register_config.address}"] += 1
+                _LOGGER.error("Error reading %s register %s: %s",
+                            register_type.value, register_id, err)
+                self._count_error(f"{register_type.value}_{register_config.address}")
                 
         return data
 
-    def _read_coil_registers_enhanced(self) -> Dict[str, Any]:
-        """Read coil registers using register manager."""
-        data = {}
-        enabled_registers = self.register_manager.get_enabled_registers(RegisterType.COIL)
-        
-        # Read coil registers individually for reliability
-        for register_id, register_config in enabled_registers.items():
-            try:
-                result = self._client.read_coils(
-                    address=register_config.address,
-                    count=1,
-                    slave=self.slave_id
-                )
-                
-                if not result.isError():
-                    value = result.bits[0]
-                    data[register_id] = {
-                        "value": value,
-                        "name": register_config.name,
-                        "description": register_config.description,
-                        "address": register_config.address,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                else:
-                    _LOGGER.error("Error reading coil register %s (addr %d): %s",
-                                register_id, register_config.address, result)
-                    self._error_counts[f"coil_{register_config.address}"] += 1
-                    
-            except Exception as err:
-                _LOGGER.error("Error reading coil register %s: %s", register_id, err)
-                self._error_counts[f"coil_{register_config.address}"] += 1
-                
-        return data
+    def _count_error(self, key: str) -> None:
+        """Count a read error, keeping at most _max_error_count distinct keys."""
+        error_counts = self._error_counts
+        if key not in error_counts and len(error_counts) >= self._max_error_count:
+            # Make room by forgetting the least frequent error
+            del error_counts[min(error_counts, key=error_counts.__getitem__)]
+        error_counts[key] = error_counts.get(key, 0) + 1
 
-    def _process_register_value(self, register_config, raw_value: int) -> Optional[Dict[str, Any]]:
-        """Process raw register value according to configuration."""
-        try:
-            # Handle signed values (temperature can be negative)
-            if raw_value > 32767:
-                raw_value = raw_value - 65536
-            
-            # Apply scaling
-            scaled_value = raw_value * register_config.scale
-            
-            # Validate value
-            if not self._data_validator.validate_value(register_config, scaled_value):
-                _LOGGER.warning(
-                    "Invalid value for register %s: %f (raw: %d)",
-                    register_config.name, scaled_value, raw_value
-                )
-                return None
-            
-            # Apply enum mapping if available
-            display_value = scaled_value
-            if register_config.enum_mapping and raw_value in register_config.enum_mapping:
-                display_value = register_config.enum_mapping[raw_value]
+    def _get_read_plan(self) -> tuple:
+        """Return the cached block read plan.
+
+        The plan holds one lane per register type with enabled registers,
+        each a tuple of (register_type, start, count, members) blocks in
+        address order.
+        """
+        plan = self._read_plan
+        if plan is None:
+            plan = self._read_plan = tuple(
+                lane
+                for lane in map(self._build_block_plan, RegisterType)
+                if lane
+            )
             
-            return {
-                "value": scaled_value,
-                "display_value": display_value,
-                "raw_value": raw_value,
-                "name": register_config.name,
-                "unit": register_config.unit,
-                "device_class": register_config.device_class,
-                "address": register_config.address,
-                "timestamp": datetime.now().isoformat()
+            # Fallback data is kept per block; drop blocks no longer read
+            current = {
+                f"{register_type.value}_{start_addr}"
+                for lane in plan
+                for register_type, start_addr, _, _ in lane
             }
+            for cache_key in [
+                key for key in self._last_successful_read if key not in current
+            ]:
+                del self._last_successful_read[cache_key]
             
-        except Exception as err:
-            _LOGGER.error("Error processing register %s: %s", register_config.name, err)
-            return None
+        return plan
+
+    def _build_block_plan(self, register_type: RegisterType) -> tuple:
+        """Build the (register_type, start, count, members) blocks for a register type.
+
+        members holds a (register_id, register_config, offset, process)
+        entry for each enabled register in the block, where process turns
+        the register's raw value into its data entry.
+        """
+        enabled_registers = self.register_manager.enabled_by_type[register_type]
+        is_coil = register_type == RegisterType.COIL
+        
+        if is_coil:
+            # Coils are single bits, so bridging a small gap of unused
+            # coils is cheaper than another request
+            blocks = self._group_registers_into_blocks(
+                enabled_registers,
+                max_count=MODBUS_MAX_COIL_READ_COUNT,
+                max_gap=COIL_READ_MAX_GAP,
+            )
+        else:
+            blocks = self._group_registers_into_blocks(enabled_registers)
+            
+        return tuple(
+            (
+                register_type,
+                start_addr,
+                count,
+                tuple(
+                    (
+                        register_id,
+                        register_config,
+                        register_config.address - start_addr,
+                        _process_coil
+                        if is_coil
+                        else _make_register_processor(register_config),
+                    )
+                    for register_id, register_config in enabled_registers.items()
+                    if start_addr <= register_config.address < start_addr + count
+                ),
+            )
+            for start_addr, count in blocks
+        )
+
+    def _group_registers_into_blocks(
+        self,
+        registers: Mapping[str, Any],
+        max_count: int = MODBUS_MAX_READ_COUNT,
+        max_gap: int = 0,
+    ) -> List[tuple]:
+        """Group registers into contiguous blocks for efficient reading.
 
-    def _group_registers_into_blocks(self, registers: Dict[str, Any]) -> List[tuple]:
-        """Group registers into contiguous blocks for efficient reading."""
+        Blocks are capped at max_count addresses, the most a single
+        Modbus read request may return. Registers up to max_gap unused
+        addresses apart are read in the same block.
+        """
         if not registers:
             return []
             
@@ -325,7 +480,10 @@ class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
         current_end = current_start
         
         for register in sorted_registers:
-            if register.address <= current_end + 1:
+            if (
+                register.address <= current_end + 1 + max_gap
+                and register.address - current_start < max_count
+            ):
                 # Extend current block
                 current_end = register.address
             else:
@@ -339,9 +497,9 @@ class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
         
         return blocks
 
-    def _get_cached_data_for_block(self, start_addr: int, count: int, 
-                                 registers: Dict[str, Any], 
-                                 register_type: RegisterType) -> Dict[str, Any]:
+    def _get_cached_data_for_block(self, start_addr: int, members: tuple,
+                                 register_type: RegisterType,
+                                 timestamp: str) -> Dict[str, Any]:
         """Get cached data for a register block when read fails."""
         cached_data = {}
         cache_key = f"{register_type.value}_{start_addr}"
@@ -349,20 +507,18 @@ class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
         if cache_key in self._last_successful_read:
             cached_registers = self._last_successful_read[cache_key]
             
-            for register_id, register_config in registers.items():
-                if start_addr <= register_config.address < start_addr + count:
-                    offset = register_config.address - start_addr
-                    if offset < len(cached_registers):
-                        raw_value = cached_registers[offset]
-                        processed_data = self._process_register_value(
-                            register_config, raw_value
-                        )
-                        
-                        if processed_data:
-                            # Mark as cached data
-                            processed_data["cached"] = True
-                            processed_data["cache_age"] = "unknown"
-                            cached_data[register_id] = processed_data
+            for register_id, _, offset, process in members:
+                if offset < len(cached_registers):
+                    processed_data = process(cached_registers[offset], timestamp)
+                    
+                    if processed_data:
+                        # Mark a copy as cached data; the processor builds
+                        # later entries for the same value from this one
+                        cached_data[register_id] = {
+                            **processed_data,
+                            "cached": True,
+                            "cache_age": "unknown",
+                        }
                             
         return cached_data
 
@@ -398,17 +554,9 @@ class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
         # Scale value for transmission
         scaled_value = int(value / register_config.scale)
         
-        try:
-            success = await self.hass.async_add_executor_job(
-                self._write_holding_register, register_config.address, scaled_value
-            )
-            if success:
-                # Trigger immediate refresh after successful write
-                await self.async_request_refresh()
-            return success
-        except Exception as err:
-            _LOGGER.error("Error writing holding register %s: %s", register_id, err)
-            return False
+        return await self._queue_write(
+            RegisterType.HOLDING, register_config.address, scaled_value
+        )
 
     async def async_write_coil_enhanced(self, register_id: str, value: bool) -> bool:
         """Write to a coil register using register manager."""
@@ -428,61 +576,129 @@ class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
         ):
             return False
             
-        try:
-            success = await self.hass.async_add_executor_job(
-                self._write_coil, register_config.address, value
-            )
-            if success:
-                # Trigger immediate refresh after successful write
-                await self.async_request_refresh()
-            return success
-        except Exception as err:
-            _LOGGER.error("Error writing coil register %s: %s", register_id, err)
-            return False
+        return await self._queue_write(
+            RegisterType.COIL, register_config.address, value
+        )
 
-    def _write_holding_register(self, address: int, value: int) -> bool:
-        """Write to a holding register (runs in executor)."""
-        try:
-            if not self._client.connect():
-                return False
-                
-            result = self._client.write_register(
-                address=address,
-                value=value,
-                slave=self.slave_id
-            )
+    def _queue_write(
+        self, register_type: RegisterType, address: int, value: Any
+    ) -> asyncio.Future:
+        """Queue a write for the next batch; the future resolves to its success."""
+        future = self.hass.loop.create_future()
+        self._write_queue.put_nowait((register_type, address, value, future))
+        if self._write_task is None or self._write_task.done():
+            self._write_task = self.hass.async_create_task(self._async_flush_writes())
+        return future
+
+    async def _async_flush_writes(self) -> None:
+        """Send queued writes once the batch window has passed.
+
+        Writes to neighbouring addresses go out as one FC16/FC15 request, and
+        a later write to the same address replaces an earlier one.
+        """
+        while True:
+            await asyncio.sleep(WRITE_BATCH_DELAY)
             
-            success = not result.isError()
-            if success:
-                # Note: async_request_refresh will be called by the calling async method
-                _LOGGER.debug("Holding register write successful for address %d", address)
+            # address -> [value, futures] per register type
+            pending: Dict[RegisterType, Dict[int, list]] = {
+                RegisterType.HOLDING: {},
+                RegisterType.COIL: {},
+            }
+            while not self._write_queue.empty():
+                register_type, address, value, future = self._write_queue.get_nowait()
+                write = pending[register_type].setdefault(address, [value, []])
+                write[0] = value
+                write[1].append(future)
             
-            return success
+            try:
+                async with self._client_lock:
+                    written = await self._async_write_batch(pending)
+            finally:
+                # Writes cut short by cleanup report failure
+                for writes in pending.values():
+                    for _, futures in writes.values():
+                        _fail_writes(futures)
             
-        finally:
-            self._client.close()
-
-    def _write_coil(self, address: int, value: bool) -> bool:
-        """Write to a coil register (runs in executor)."""
-        try:
-            if not self._client.connect():
-                return False
-                
-            result = self._client.write_coil(
-                address=address,
-                value=value,
-                slave=self.slave_id
-            )
+            if written:
+                # One refresh for the whole batch
+                await self.async_request_refresh()
             
-            success = not result.isError()
-            if success:
-                # Note: async_request_refresh will be called by the calling async method
-                _LOGGER.debug("Coil register write successful for address %d", address)
+            if self._write_queue.empty():
+                return
+
+    async def _async_write_batch(
+        self, pending: Dict[RegisterType, Dict[int, list]]
+    ) -> bool:
+        """Write one batch of pending writes; the caller holds the client lock.
+
+        Returns whether anything was written to the device.
+        """
+        written = False
+        for register_type, writes in pending.items():
+            if register_type is RegisterType.HOLDING:
+                max_count = MODBUS_MAX_WRITE_COUNT
+            else:
+                max_count = MODBUS_MAX_COIL_WRITE_COUNT
             
-            return success
+            run: List[int] = []
+            for address in sorted(writes):
+                if run and (address != run[-1] + 1 or len(run) >= max_count):
+                    written |= await self._async_write_run(register_type, run, writes)
+                    run = []
+                run.append(address)
             
-        finally:
-            self._client.close()
+            if run:
+                written |= await self._async_write_run(register_type, run, writes)
+        
+        return written
+
+    async def _async_write_run(
+        self, register_type: RegisterType, addresses: List[int], writes: Dict[int, list]
+    ) -> bool:
+        """Write one run of contiguous addresses and resolve its futures.
+
+        The caller holds the client lock.
+        """
+        start = addresses[0]
+        values = [writes[address][0] for address in addresses]
+        success = False
+        try:
+            if await self._async_ensure_connected():
+                if register_type is RegisterType.HOLDING:
+                    if len(values) == 1:
+                        result = await self._client.write_register(
+                            address=start, value=values[0], slave=self.slave_id
+                        )
+                    else:
+                        result = await self._client.write_registers(
+                            address=start, values=values, slave=self.slave_id
+                        )
+                elif len(values) == 1:
+                    result = await self._client.write_coil(
+                        address=start, value=values[0], slave=self.slave_id
+                    )
+                else:
+                    result = await self._client.write_coils(
+                        address=start, values=values, slave=self.slave_id
+                    )
+                success = not result.isError()
+        except Exception as err:
+            _LOGGER.error(
+                "Error writing %s registers %d-%d: %s",
+                register_type.value, start, addresses[-1], err
+            )
+        
+        if success:
+            _LOGGER.debug(
+                "%s register write successful for addresses %d-%d",
+                register_type.value, start, addresses[-1]
+            )
+        for address in addresses:
+            for future in writes[address][1]:
+                if not future.done():
+                    future.set_result(success)
+        
+        return success
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics for the coordinator."""
@@ -493,13 +709,13 @@ class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
             "register_performance": {}
         }
         
-        for register_id, durations in self._read_performance.items():
-            if durations:
+        for register_id, read_stats in self._read_performance.items():
+            if read_stats.count:
                 stats["register_performance"][register_id] = {
-                    "avg_read_time": sum(durations) / len(durations),
-                    "max_read_time": max(durations),
-                    "min_read_time": min(durations),
-                    "read_count": len(durations)
+                    "avg_read_time": read_stats.total / read_stats.count,
+                    "max_read_time": read_stats.maximum,
+                    "min_read_time": read_stats.minimum,
+                    "read_count": read_stats.count
                 }
                 
         return stats
@@ -507,9 +723,13 @@ class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
     async def async_cleanup(self) -> None:
         """Clean up resources on shutdown."""
         try:
-            # Close Modbus client if open
-            if self._client and hasattr(self._client, 'close'):
-                await self.hass.async_add_executor_job(self._client.close)
+            # Fail writes still waiting for their batch and close the
+            # Modbus connection
+            if self._write_task is not None:
+                self._write_task.cancel()
+            while not self._write_queue.empty():
+                _fail_writes((self._write_queue.get_nowait()[3],))
+            self._client.close()
                 
             # Clear performance tracking data
             self._read_performance.clear()
@@ -525,33 +745,3 @@ class GrantAerona3EnhancedCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Error during coordinator cleanup: %s", err)
 
-
-class DataValidator:
-    """Validates register data for consistency and sanity."""
-    
-    def __init__(self):
-        """Initialize data validator."""
-        self.validation_rules = {
-            "temperature": {"min": -50.0, "max": 100.0},
-            "power": {"min": 0.0, "max": 20000.0},
-            "frequency": {"min": 0.0, "max": 150.0},
-            "humidity": {"min": 0.0, "max": 100.0},
-        }
-        
-    def validate_value(self, register_config, value: float) -> bool:
-        """Validate a register value."""
-        # Check device class specific rules
-        if register_config.device_class in self.validation_rules:
-            rules = self.validation_rules[register_config.device_class]
-            
-            if value < rules["min"] or value > rules["max"]:
-                return False
-                
-        # Check register-specific min/max
-        if register_config.min_value is not None and value < register_config.min_value:
-            return False
-            
-        if register_config.max_value is not None and value > register_config.max_value:
-            return False
-            
-        return True
\ No newline at end of file
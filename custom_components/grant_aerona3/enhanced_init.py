@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
+from types import MappingProxyType
 from typing import Dict, Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -24,6 +25,31 @@ PLATFORMS = [
     Platform.SWITCH,      # Always available
     Platform.NUMBER,      # Always available for setpoints
 ]
+# Every configuration sets up the same platforms; features only add
+# entities to them
+_BASE_PLATFORMS: tuple[str, ...] = tuple(PLATFORMS)
+
+# Defaults filled in when migrating a v1 configuration
+_DEFAULT_ZONES = MappingProxyType({
+    "zone_1": MappingProxyType({"enabled": True, "name": "Main Zone"}),
+    "zone_2": MappingProxyType({"enabled": False, "name": "Second Zone"}),
+})
+_FEATURE_DEFAULTS = MappingProxyType({
+    "dhw_cylinder": False,
+    "backup_heater": False,
+    "weather_compensation": True,
+    "flow_rate_method": "fixed_rate",
+    "flow_rate": 20,
+    "advanced_features": False,
+    "diagnostic_monitoring": False,
+    "config_version": 2
+})
+
+_REQUIRED_FIELDS = frozenset({"host", "port", "slave_id"})
+_VALID_TEMPLATES = frozenset({
+    "single_zone_basic", "single_zone_dhw",
+    "dual_zone_system", "replacement_system",
+})
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -144,23 +170,11 @@ def _migrate_config_v1_to_v2(old_config: Dict[str, Any]) -> Dict[str, Any]:
     # Set default zone configuration
     if "zones" not in new_config:
         new_config["zones"] = {
-            "zone_1": {"enabled": True, "name": "Main Zone"},
-            "zone_2": {"enabled": False, "name": "Second Zone"}
+            zone_id: dict(zone) for zone_id, zone in _DEFAULT_ZONES.items()
         }
     
     # Set default feature flags
-    feature_defaults = {
-        "dhw_cylinder": False,
-        "backup_heater": False,
-        "weather_compensation": True,
-        "flow_rate_method": "fixed_rate",
-        "flow_rate": 20,
-        "advanced_features": False,
-        "diagnostic_monitoring": False,
-        "config_version": 2
-    }
-    
-    for key, default_value in feature_defaults.items():
+    for key, default_value in _FEATURE_DEFAULTS.items():
         if key not in new_config:
             new_config[key] = default_value
     
@@ -172,18 +186,12 @@ def _validate_config(config: Dict[str, Any]) -> list[str]:
     errors = []
     
     # Required fields
-    required_fields = ["host", "port", "slave_id"]
-    for field in required_fields:
-        if field not in config:
-            errors.append(f"Missing required field: {field}")
+    for field in sorted(_REQUIRED_FIELDS - config.keys()):
+        errors.append(f"Missing required field: {field}")
     
     # Validate installation template
-    valid_templates = [
-        "single_zone_basic", "single_zone_dhw", 
-        "dual_zone_system", "replacement_system"
-    ]
     template = config.get("installation_template")
-    if template and template not in valid_templates:
+    if template and template not in _VALID_TEMPLATES:
         errors.append(f"Invalid installation template: {template}")
     
     # Validate flow rate settings
@@ -201,28 +209,10 @@ def _validate_config(config: Dict[str, Any]) -> list[str]:
     return errors
 
 
-def _get_platforms_for_config(config: Dict[str, Any]) -> list[str]:
-    """Get list of platforms to set up based on configuration."""
-    platforms = [
-        Platform.SENSOR,        # Always needed
-        Platform.BINARY_SENSOR, # Always needed  
-        Platform.CLIMATE,       # Always needed for zone control
-        Platform.SWITCH,        # Always needed for basic controls
-    ]
-    
-    # Add number platform for setpoints (always needed)
-    platforms.append(Platform.NUMBER)
-    
-    # Add additional platforms based on features
-    if config.get("dhw_cylinder", False):
-        # DHW adds additional sensors and controls
-        pass  # Already included in base platforms
-        
-    if config.get("backup_heater", False):
-        # Backup heater adds additional switches
-        pass  # Already included in base platforms
-    
-    return platforms
+def _get_platforms_for_config(config: Dict[str, Any]) -> tuple[str, ...]:
+    """Get the platforms to set up based on configuration."""
+    # DHW and backup heater only add entities to the base platforms
+    return _BASE_PLATFORMS
 
 
 async def _setup_services(hass: HomeAssistant, coordinator: GrantAerona3EnhancedCoordinator) -> None:
@@ -264,7 +254,7 @@ class GrantAerona3Integration:
         self.hass = hass
         self.entry = entry
         self.coordinator: GrantAerona3EnhancedCoordinator = None
-        self.platforms_loaded = []
+        self.platforms_loaded: tuple = ()
         
     async def async_setup(self) -> bool:
         """Set up the integration."""
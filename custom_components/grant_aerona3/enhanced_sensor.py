@@ -22,13 +22,15 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL
+from .const import DOMAIN
 from .enhanced_coordinator import GrantAerona3EnhancedCoordinator
 from .register_manager import RegisterType, RegisterCategory
 from .weather_compensation_entities import async_setup_weather_compensation_entities
 
 _LOGGER = logging.getLogger(__name__)
 
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -98,13 +100,7 @@ class GrantAerona3EnhancedSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = f"Grant Aerona3 {register_config.name}"
         
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
         
         # Set sensor properties
         self._attr_native_unit_of_measurement = register_config.unit
@@ -229,13 +225,7 @@ class GrantAerona3EnhancedPowerSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_class = SensorDeviceClass.POWER
         self._attr_state_class = SensorStateClass.MEASUREMENT
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
         
         # Power tracking for statistics
         self._power_history = []
@@ -287,13 +277,7 @@ class GrantAerona3EnhancedCOPSensor(CoordinatorEntity, SensorEntity):
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_icon = "mdi:thermometer-chevron-up"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
         
         self._config = config_entry.data
 
@@ -410,13 +394,7 @@ class GrantAerona3SystemRuntimeSensor(CoordinatorEntity, SensorEntity):
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
         self._attr_entity_category = "diagnostic"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Optional[float]:
@@ -442,13 +420,7 @@ class GrantAerona3EfficiencySensor(CoordinatorEntity, SensorEntity):
         self._attr_native_unit_of_measurement = PERCENTAGE
         self._attr_icon = "mdi:gauge"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Optional[float]:
@@ -480,13 +452,7 @@ class GrantAerona3SystemHealthSensor(CoordinatorEntity, SensorEntity):
         self._attr_icon = "mdi:heart-pulse"
         self._attr_entity_category = "diagnostic"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> str:
@@ -548,13 +514,7 @@ class GrantAerona3ErrorStatusSensor(CoordinatorEntity, SensorEntity):
         self._attr_icon = "mdi:alert-circle"
         self._attr_entity_category = "diagnostic"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> str:
@@ -593,13 +553,7 @@ class GrantAerona3PerformanceMetricsSensor(CoordinatorEntity, SensorEntity):
         self._attr_icon = "mdi:chart-line"
         self._attr_entity_category = "diagnostic"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> str:
@@ -649,13 +603,7 @@ class GrantAerona3EnhancedEnergySensor(CoordinatorEntity, SensorEntity):
         self._attr_device_class = SensorDeviceClass.ENERGY
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
         
         self._last_power = None
         self._last_update = None
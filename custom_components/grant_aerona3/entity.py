@@ -0,0 +1,17 @@
+"""Shared entity base for Grant Aerona3 entities."""
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+
+class GrantAerona3CachedEntity(CoordinatorEntity):
+    """Coordinator entity whose cached properties reset on each update."""
+
+    # Names of cached_property attributes derived from coordinator data
+    _CACHED_PROPERTIES: tuple[str, ...] = ()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop cached state before writing the new coordinator data."""
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+        super()._handle_coordinator_update()
@@ -9,11 +9,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, HOLDING_REGISTER_MAP, MANUFACTURER, MODEL
+from .const import DOMAIN, HOLDING_DATA_KEYS, HOLDING_REGISTER_MAP, RegSpec
 from .coordinator import GrantAerona3Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,15 +25,11 @@ async def async_setup_entry(
     """Set up Grant Aerona3 number entities."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = []
-    
     # Create number entities for all holding registers
-    for addr, config in HOLDING_REGISTER_MAP.items():
-        entities.append(
-            GrantAerona3Number(coordinator, config_entry, addr, config)
-        )
-    
-    async_add_entities(entities)
+    async_add_entities(
+        GrantAerona3Number(coordinator, config_entry, addr, config)
+        for addr, config in HOLDING_REGISTER_MAP.items()
+    )
 
 
 class GrantAerona3Number(CoordinatorEntity, NumberEntity):
@@ -42,52 +40,43 @@ class GrantAerona3Number(CoordinatorEntity, NumberEntity):
         coordinator: GrantAerona3Coordinator,
         config_entry: ConfigEntry,
         register_addr: int,
-        register_config: dict[str, Any],
+        register_config: RegSpec,
     ) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
         self._register_addr = register_addr
+        self._data_key = HOLDING_DATA_KEYS[register_addr]
         self._register_config = register_config
         
         self._attr_unique_id = f"{config_entry.entry_id}_number_{register_addr}"
-        self._attr_name = f"Grant Aerona3 {register_config['name']}"
+        self._attr_name = f"Grant Aerona3 {register_config.name}"
         
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
         
         # Set number properties
-        self._attr_native_min_value = register_config["min"]
-        self._attr_native_max_value = register_config["max"]
         self._attr_native_step = 0.5  # 0.5°C steps
-        self._attr_native_unit_of_measurement = register_config["unit"]
+        self._attr_native_unit_of_measurement = register_config.unit
         self._attr_mode = "box"  # Allow direct input
 
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        data_key = f"holding_{self._register_addr}"
-        if data_key in self.coordinator.data:
-            return self.coordinator.data[data_key]["value"]
+        if self._data_key in self.coordinator.data:
+            return self.coordinator.data[self._data_key].value
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        data_key = f"holding_{self._register_addr}"
-        if data_key not in self.coordinator.data:
+        if self._data_key not in self.coordinator.data:
             return {}
             
         return {
-            "raw_value": self.coordinator.data[data_key]["raw_value"],
+            "raw_value": self.coordinator.data[self._data_key].raw_value,
             "register_address": self._register_addr,
-            "min_value": self._register_config["min"],
-            "max_value": self._register_config["max"],
+            "min_value": self.native_min_value,
+            "max_value": self.native_max_value,
         }
 
     async def async_set_native_value(self, value: float) -> None:
@@ -96,12 +85,12 @@ class GrantAerona3Number(CoordinatorEntity, NumberEntity):
         raw_value = int(value * 2)
         
         # Ensure value is within bounds
-        if value < self._attr_native_min_value or value > self._attr_native_max_value:
+        if value < self.native_min_value or value > self.native_max_value:
             _LOGGER.error(
                 "Temperature %s is out of bounds (%s-%s) for %s",
                 value,
-                self._attr_native_min_value,
-                self._attr_native_max_value,
+                self.native_min_value,
+                self.native_max_value,
                 self._attr_name,
             )
             return
@@ -5,6 +5,7 @@ from typing import Any
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -24,15 +25,40 @@ from .const import (
     DAYS_OF_WEEK,
     DHW_MODES,
     DOMAIN,
+    INPUT_DATA_KEYS,
     INPUT_REGISTER_MAP,
-    MANUFACTURER,
-    MODEL,
     OPERATING_MODES,
 )
 from .coordinator import GrantAerona3Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+PARALLEL_UPDATES = 0
+
+# Device classes whose register values are reported as measurements
+_MEASUREMENT_DEVICE_CLASSES = (
+    SensorDeviceClass.TEMPERATURE,
+    SensorDeviceClass.POWER,
+    SensorDeviceClass.FREQUENCY,
+)
+
+# Descriptions for the register-backed sensors, built once at import and
+# shared by every config entry
+INPUT_SENSOR_DESCRIPTIONS = tuple(
+    SensorEntityDescription(
+        key=str(addr),
+        name=f"Grant Aerona3 {spec.name}",
+        native_unit_of_measurement=spec.unit,
+        device_class=spec.device_class,
+        state_class=(
+            SensorStateClass.MEASUREMENT
+            if spec.device_class in _MEASUREMENT_DEVICE_CLASSES
+            else None
+        ),
+    )
+    for addr, spec in INPUT_REGISTER_MAP.items()
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -42,22 +68,16 @@ async def async_setup_entry(
     """Set up Grant Aerona3 sensor entities."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = []
-    
-    # Create sensors for all input registers
-    for addr, config in INPUT_REGISTER_MAP.items():
-        entities.append(
-            GrantAerona3Sensor(coordinator, config_entry, addr, config)
-        )
-    
-    # Add calculated sensors
-    entities.extend([
+    # Create sensors for all input registers, followed by calculated sensors
+    async_add_entities([
+        *(
+            GrantAerona3Sensor(coordinator, config_entry, description)
+            for description in INPUT_SENSOR_DESCRIPTIONS
+        ),
         GrantAerona3PowerSensor(coordinator, config_entry),
         GrantAerona3EnergySensor(coordinator, config_entry),
         GrantAerona3COPSensor(coordinator, config_entry),
     ])
-    
-    async_add_entities(entities)
 
 
 class GrantAerona3Sensor(CoordinatorEntity, SensorEntity):
@@ -67,46 +87,26 @@ class GrantAerona3Sensor(CoordinatorEntity, SensorEntity):
         self,
         coordinator: GrantAerona3Coordinator,
         config_entry: ConfigEntry,
-        register_addr: int,
-        register_config: dict[str, Any],
+        description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._register_addr = register_addr
-        self._register_config = register_config
+        self.entity_description = description
+        self._register_addr = int(description.key)
+        self._data_key = INPUT_DATA_KEYS[self._register_addr]
         
-        self._attr_unique_id = f"{config_entry.entry_id}_sensor_{register_addr}"
-        self._attr_name = f"Grant Aerona3 {register_config['name']}"
+        self._attr_unique_id = f"{config_entry.entry_id}_sensor_{description.key}"
         
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "1.0.0",
-        }
-        
-        # Set sensor properties based on register config
-        self._attr_native_unit_of_measurement = register_config.get("unit")
-        self._attr_device_class = register_config.get("device_class")
-        
-        # Set state class for numeric sensors
-        if register_config.get("device_class") in [
-            SensorDeviceClass.TEMPERATURE,
-            SensorDeviceClass.POWER,
-            SensorDeviceClass.FREQUENCY,
-        ]:
-            self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        data_key = f"input_{self._register_addr}"
-        if data_key not in self.coordinator.data:
+        if self._data_key not in self.coordinator.data:
             return None
             
-        value = self.coordinator.data[data_key]["value"]
+        value = self.coordinator.data[self._data_key].value
         
         # Handle special cases for enum values
         if self._register_addr == 10:  # Operating mode
@@ -126,12 +126,11 @@ class GrantAerona3Sensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        data_key = f"input_{self._register_addr}"
-        if data_key not in self.coordinator.data:
+        if self._data_key not in self.coordinator.data:
             return {}
             
         return {
-            "raw_value": self.coordinator.data[data_key]["raw_value"],
+            "raw_value": self.coordinator.data[self._data_key].raw_value,
             "register_address": self._register_addr,
         }
 
@@ -154,19 +153,13 @@ class GrantAerona3PowerSensor(CoordinatorEntity, SensorEntity):
         self._attr_state_class = SensorStateClass.MEASUREMENT
         
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
         """Return the power consumption in watts."""
         if "input_3" in self.coordinator.data:
-            return self.coordinator.data["input_3"]["value"]
+            return self.coordinator.data["input_3"].value
         return None
 
 
@@ -188,13 +181,7 @@ class GrantAerona3EnergySensor(CoordinatorEntity, SensorEntity):
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
         
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
         
         self._last_power = None
         self._total_energy = 0.0
@@ -206,7 +193,7 @@ class GrantAerona3EnergySensor(CoordinatorEntity, SensorEntity):
         # In a real implementation, you might want to use the integration sensor
         # or store energy data persistently
         if "input_3" in self.coordinator.data:
-            current_power = self.coordinator.data["input_3"]["value"]
+            current_power = self.coordinator.data["input_3"].value
             
             if self._last_power is not None and current_power > 0:
                 # Estimate energy based on power and time interval
@@ -238,13 +225,7 @@ class GrantAerona3COPSensor(CoordinatorEntity, SensorEntity):
         self._attr_state_class = SensorStateClass.MEASUREMENT
         
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
@@ -256,7 +237,7 @@ class GrantAerona3COPSensor(CoordinatorEntity, SensorEntity):
         if "input_3" not in self.coordinator.data:
             return None
             
-        power_consumption = self.coordinator.data["input_3"]["value"]
+        power_consumption = self.coordinator.data["input_3"].value
         
         if power_consumption <= 0:
             return None
@@ -266,9 +247,9 @@ class GrantAerona3COPSensor(CoordinatorEntity, SensorEntity):
         return_temp = None
         
         if "input_9" in self.coordinator.data:
-            flow_temp = self.coordinator.data["input_9"]["value"]
+            flow_temp = self.coordinator.data["input_9"].value
         if "input_0" in self.coordinator.data:
-            return_temp = self.coordinator.data["input_0"]["value"]
+            return_temp = self.coordinator.data["input_0"].value
         
         if flow_temp is None or return_temp is None:
             return None
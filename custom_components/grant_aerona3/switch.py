@@ -8,11 +8,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import COIL_REGISTER_MAP, DOMAIN, MANUFACTURER, MODEL
+from .const import COIL_DATA_KEYS, COIL_REGISTER_MAP, DOMAIN, RegSpec
 from .coordinator import GrantAerona3Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -22,15 +24,11 @@ async def async_setup_entry(
     """Set up Grant Aerona3 switch entities."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = []
-    
     # Create switches for all coil registers
-    for addr, config in COIL_REGISTER_MAP.items():
-        entities.append(
-            GrantAerona3Switch(coordinator, config_entry, addr, config)
-        )
-    
-    async_add_entities(entities)
+    async_add_entities(
+        GrantAerona3Switch(coordinator, config_entry, addr, config)
+        for addr, config in COIL_REGISTER_MAP.items()
+    )
 
 
 class GrantAerona3Switch(CoordinatorEntity, SwitchEntity):
@@ -41,38 +39,32 @@ class GrantAerona3Switch(CoordinatorEntity, SwitchEntity):
         coordinator: GrantAerona3Coordinator,
         config_entry: ConfigEntry,
         register_addr: int,
-        register_config: dict[str, Any],
+        register_config: RegSpec,
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
         self._register_addr = register_addr
+        self._data_key = COIL_DATA_KEYS[register_addr]
         self._register_config = register_config
         
         self._attr_unique_id = f"{config_entry.entry_id}_switch_{register_addr}"
-        self._attr_name = f"Grant Aerona3 {register_config['name']}"
+        self._attr_name = f"Grant Aerona3 {register_config.name}"
         
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return true if switch is on."""
-        data_key = f"coil_{self._register_addr}"
-        if data_key in self.coordinator.data:
-            return self.coordinator.data[data_key]["value"]
+        if self._data_key in self.coordinator.data:
+            return self.coordinator.data[self._data_key].value
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         return {
-            "description": self._register_config["description"],
+            "description": self._register_config.description,
             "register_address": self._register_addr,
         }
 
@@ -14,7 +14,6 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL
 from .enhanced_coordinator import GrantAerona3EnhancedCoordinator
 from .weather_compensation import WeatherCompensationController
 
@@ -87,13 +86,7 @@ class WeatherCompensationStatusSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = "Grant Aerona3 Weather Compensation Status"
         self._attr_icon = "mdi:thermometer-auto"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> str:
@@ -159,13 +152,7 @@ class WeatherCompensationTargetTempSensor(CoordinatorEntity, SensorEntity):
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_icon = "mdi:thermometer-water"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Optional[float]:
@@ -202,13 +189,7 @@ class WeatherCompensationCurveSensor(CoordinatorEntity, SensorEntity):
         self._attr_icon = "mdi:chart-line"
         self._attr_entity_category = "diagnostic"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> str:
@@ -252,13 +233,7 @@ class WeatherCompensationEfficiencySensor(CoordinatorEntity, SensorEntity):
         self._attr_icon = "mdi:percent"
         self._attr_entity_category = "diagnostic"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Optional[float]:
@@ -302,13 +277,7 @@ class WeatherCompensationBoostSwitch(CoordinatorEntity, SwitchEntity):
         self._attr_name = "Grant Aerona3 WC Boost Mode"
         self._attr_icon = "mdi:fire"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -366,13 +335,7 @@ class WeatherCompensationBoostStatusSensor(CoordinatorEntity, BinarySensorEntity
         self._attr_icon = "mdi:fire"
         self._attr_entity_category = "diagnostic"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -401,13 +364,7 @@ class WeatherCompensationBoostRemainingTimeSensor(CoordinatorEntity, SensorEntit
         self._attr_icon = "mdi:timer"
         self._attr_entity_category = "diagnostic"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Optional[int]:
@@ -445,13 +402,7 @@ class WeatherCompensationMinOutdoorTempNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_step = 0.5
         self._attr_icon = "mdi:thermometer-minus"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Optional[float]:
@@ -491,13 +442,7 @@ class WeatherCompensationMaxOutdoorTempNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_step = 0.5
         self._attr_icon = "mdi:thermometer-plus"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Optional[float]:
@@ -535,13 +480,7 @@ class WeatherCompensationMinFlowTempNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_step = 0.5
         self._attr_icon = "mdi:water-thermometer"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Optional[float]:
@@ -579,13 +518,7 @@ class WeatherCompensationMaxFlowTempNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_step = 0.5
         self._attr_icon = "mdi:water-thermometer"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Optional[float]:
@@ -618,13 +551,7 @@ class WeatherCompensationBoostCurveStatusSensor(CoordinatorEntity, SensorEntity)
         self._attr_icon = "mdi:chart-line-variant"
         self._attr_entity_category = "diagnostic"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> str:
@@ -673,13 +600,7 @@ class WeatherCompensationCurveComparisonSensor(CoordinatorEntity, SensorEntity):
         self._attr_icon = "mdi:compare"
         self._attr_entity_category = "diagnostic"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "Grant Aerona3 Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> str:
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Test batched writes in the enhanced Grant Aerona3 coordinator."""
+
+import asyncio
+import sys
+import unittest
+from collections import defaultdict
+from unittest.mock import AsyncMock, Mock
+
+# Add the custom_components path for testing
+sys.path.insert(0, './custom_components')
+
+from grant_aerona3.enhanced_coordinator import GrantAerona3EnhancedCoordinator
+from grant_aerona3.register_manager import RegisterType
+
+
+class TestEnhancedCoordinatorWrites(unittest.IsolatedAsyncioTestCase):
+    """Test the write queue, batching and future resolution."""
+
+    async def asyncSetUp(self):
+        """Build a coordinator around a mocked Modbus client."""
+        loop = asyncio.get_running_loop()
+        result = Mock()
+        result.isError.return_value = False
+
+        self.client = Mock()
+        self.client.connected = True
+        for method in ("write_register", "write_registers", "write_coil", "write_coils"):
+            setattr(self.client, method, AsyncMock(return_value=result))
+
+        # Skip DataUpdateCoordinator setup; only the write path is exercised
+        coordinator = GrantAerona3EnhancedCoordinator.__new__(GrantAerona3EnhancedCoordinator)
+        coordinator.hass = Mock(loop=loop, async_create_task=loop.create_task)
+        coordinator.data = {}
+        coordinator.slave_id = 1
+        coordinator._client = self.client
+        coordinator._client_lock = asyncio.Lock()
+        coordinator._write_queue = asyncio.Queue()
+        coordinator._write_task = None
+        coordinator._read_performance = defaultdict(list)
+        coordinator._error_counts = {}
+        coordinator._last_successful_read = {}
+        coordinator.weather_compensation = Mock(spec=[])
+        coordinator.async_request_refresh = AsyncMock()
+        self.coordinator = coordinator
+
+    def _write(self, register_type, address, value):
+        """Queue a write and return its future."""
+        return self.coordinator._queue_write(register_type, address, value)
+
+    async def test_contiguous_writes_share_one_request(self):
+        """Test neighbouring holding writes go out as one FC16 request."""
+        results = await asyncio.gather(
+            self._write(RegisterType.HOLDING, 10, 1),
+            self._write(RegisterType.HOLDING, 11, 2),
+            self._write(RegisterType.HOLDING, 30, 7),
+            self._write(RegisterType.COIL, 3, True),
+        )
+
+        self.assertEqual(results, [True, True, True, True])
+        self.client.write_registers.assert_awaited_once_with(
+            address=10, values=[1, 2], slave=1
+        )
+        self.client.write_register.assert_awaited_once_with(
+            address=30, value=7, slave=1
+        )
+        self.client.write_coil.assert_awaited_once_with(
+            address=3, value=True, slave=1
+        )
+        self.coordinator.async_request_refresh.assert_awaited_once()
+
+    async def test_later_write_to_same_address_wins(self):
+        """Test repeated writes to one address send only the last value."""
+        first = self._write(RegisterType.HOLDING, 10, 1)
+        second = self._write(RegisterType.HOLDING, 10, 5)
+
+        self.assertEqual(await asyncio.gather(first, second), [True, True])
+        self.client.write_register.assert_awaited_once_with(
+            address=10, value=5, slave=1
+        )
+
+    async def test_failed_write_resolves_false(self):
+        """Test a write that raises resolves its future as failed."""
+        self.client.write_register.side_effect = ConnectionError("lost")
+
+        self.assertFalse(await self._write(RegisterType.HOLDING, 10, 1))
+        self.coordinator.async_request_refresh.assert_not_awaited()
+
+    async def test_cleanup_fails_pending_writes(self):
+        """Test cleanup resolves writes still waiting for their batch."""
+        futures = [
+            self._write(RegisterType.HOLDING, 10, 1),
+            self._write(RegisterType.COIL, 3, True),
+        ]
+
+        await self.coordinator.async_cleanup()
+
+        self.assertEqual(await asyncio.gather(*futures), [False, False])
+        self.client.write_register.assert_not_awaited()
+        self.client.write_coil.assert_not_awaited()
+
+    async def test_cleanup_fails_batch_in_flight(self):
+        """Test cleanup resolves writes whose batch is being sent."""
+        started = asyncio.Event()
+
+        async def hang(**kwargs):
+            started.set()
+            await asyncio.Event().wait()
+
+        self.client.write_register.side_effect = hang
+        future = self._write(RegisterType.HOLDING, 10, 1)
+        await started.wait()
+
+        await self.coordinator.async_cleanup()
+
+        self.assertFalse(await future)
+
+
+def main():
+    """Run the enhanced coordinator write tests."""
+    print("Running Grant Aerona3 Enhanced Coordinator Write Tests...")
+    print("=" * 55)
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestEnhancedCoordinatorWrites)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    if result.wasSuccessful():
+        print("\n✅ All write tests passed!")
+        return True
+
+    print("\n❌ Some tests failed!")
+    return False
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)